@@ -0,0 +1,186 @@
+"""
+In-process caches for request authentication.
+
+PRINCIPAL CACHE:
+- Maps a token subject (user email) to the User loaded for it, so protected
+  requests skip the user lookup query
+- Bounded, least recently used entries are evicted first
+- Entries of a user are dropped after the COMMIT that updates or deletes it
+  (e.g. deactivation); bulk UPDATE/DELETE statements on users clear the cache
+- Entries also expire after PRINCIPAL_CACHE_TTL_SECONDS to bound staleness
+  when several worker processes write to the same database
+
+Cached users are detached from any session and must be treated as read-only.
+
+TOKEN CACHE:
+- Maps the SHA-256 digest of a verified JWT to its (subject, exp), so a
+  token presented again skips signature verification and claim parsing
+- Bounded LRU; entries are dropped once the token expires
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+_CHANGED_USERS_KEY = "principal_cache_changed_users"
+
+# Marker for "clear everything" in the changed users set
+_ALL_USERS = object()
+
+
+class PrincipalCache:
+    """Process-wide LRU cache of authenticated users by token subject."""
+    
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, subject: str) -> Optional[Any]:
+        """Get the cached user for a token subject, or None."""
+        entry = self._entries.get(subject)
+        if entry is not None:
+            user, stored_at = entry
+            if time.monotonic() - stored_at < self.ttl_seconds:
+                self._entries.move_to_end(subject)
+                self.hits += 1
+                return user
+            del self._entries[subject]
+        
+        self.misses += 1
+        return None
+    
+    def put(self, subject: str, user: Any) -> None:
+        """Cache a (detached) user for a token subject."""
+        self._entries[subject] = (user, time.monotonic())
+        self._entries.move_to_end(subject)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def evict_user(self, user_id: int) -> None:
+        """Drop all entries of a user."""
+        for subject in [
+            subject for subject, (user, _) in self._entries.items()
+            if user.id == user_id
+        ]:
+            del self._entries[subject]
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+    
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        return _cache_stats(len(self._entries), self.max_entries, self.hits, self.misses)
+
+
+class TokenCache:
+    """Process-wide LRU cache of verified access tokens."""
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def digest(token: str) -> bytes:
+        """Cache key for a raw token (the token itself is never stored)."""
+        return hashlib.sha256(token.encode("utf-8")).digest()
+    
+    def get(self, token_digest: bytes) -> Optional[str]:
+        """Get the subject of a previously verified, unexpired token, or None."""
+        entry = self._entries.get(token_digest)
+        if entry is not None:
+            subject, expires_at = entry
+            if time.time() < expires_at:
+                self._entries.move_to_end(token_digest)
+                self.hits += 1
+                return subject
+            del self._entries[token_digest]
+        
+        self.misses += 1
+        return None
+    
+    def put(self, token_digest: bytes, subject: str, expires_at: float) -> None:
+        """Cache a verified token until its exp claim."""
+        self._entries[token_digest] = (subject, expires_at)
+        self._entries.move_to_end(token_digest)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        return _cache_stats(len(self._entries), self.max_entries, self.hits, self.misses)
+
+
+def _cache_stats(entries: int, max_entries: int, hits: int, misses: int) -> dict:
+    lookups = hits + misses
+    
+    return {
+        "entries": entries,
+        "max_entries": max_entries,
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups * 100, 2) if lookups else 0
+    }
+
+
+principal_cache = PrincipalCache(
+    settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+token_cache = TokenCache(settings.TOKEN_CACHE_MAX_ENTRIES)
+
+
+# =============================================================================
+# SESSION EVENTS
+# =============================================================================
+
+def _changed_users(session: Session) -> set:
+    return session.info.setdefault(_CHANGED_USERS_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_user_changes(session: Session, flush_context) -> None:
+    """Remember updated or deleted users until the transaction commits."""
+    for obj in (*session.dirty, *session.deleted):
+        if getattr(obj, "__tablename__", None) == "users" and obj.id is not None:
+            _changed_users(session).add(obj.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_user_statements(orm_execute_state) -> None:
+    """Bulk UPDATE/DELETE on users may touch any cached user."""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) == "users":
+        _changed_users(orm_execute_state.session).add(_ALL_USERS)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_changed_users(session: Session) -> None:
+    """Evict changed users once the change is durable."""
+    changed = session.info.pop(_CHANGED_USERS_KEY, None)
+    if not changed:
+        return
+    
+    if _ALL_USERS in changed:
+        principal_cache.clear()
+        return
+    
+    for user_id in changed:
+        principal_cache.evict_user(user_id)
@@ -5,6 +5,7 @@ Loads configuration from environment variables and .env file.
 
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -13,11 +14,43 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./hotel_pms.db"
     
+    # Optional read-only replica for read endpoints (calendar, analytics,
+    # lists); unset = reads use DATABASE_URL
+    READ_DATABASE_URL: Optional[str] = None
+    
+    # Connection pool
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # -1 to never recycle
+    DB_STATEMENT_TIMEOUT_MS: int = 30000  # PostgreSQL only, 0 to disable
+    
+    # SQLite connection pragmas (applied on connect)
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MB
+    SQLITE_CACHE_SIZE: int = -64000  # Negative = KiB (64 MB)
+    
     # JWT Configuration
     SECRET_KEY: str = "dev-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Password hashing (bcrypt runs in a bounded thread pool)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # Waiting + running before 503
+    
+    # Authenticated user cache (skips the user lookup on protected requests)
+    PRINCIPAL_CACHE_ENABLED: bool = True
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 1024
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    
+    # Verified token cache (skips JWT verification for repeated tokens)
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_MAX_ENTRIES: int = 1024
+    
     # Admin User
     ADMIN_EMAIL: str = "admin@hotel.com"
     ADMIN_PASSWORD: str = "admin123"
@@ -25,6 +58,35 @@ class Settings(BaseSettings):
     # Inventory
     INVENTORY_DAYS_AHEAD: int = 90
     
+    # Inventory maintenance (background horizon extender)
+    INVENTORY_MAINTENANCE_ENABLED: bool = True
+    INVENTORY_MAINTENANCE_INTERVAL_HOURS: int = 24
+    INVENTORY_ARCHIVE_ENABLED: bool = False
+    INVENTORY_ARCHIVE_AFTER_DAYS: int = 30  # Past days kept in the hot table
+    
+    # Calendar availability grid / matrix
+    CALENDAR_MAX_RANGE_DAYS: int = 731  # Longest start..end range served
+    
+    # In-memory availability index (read paths only)
+    AVAILABILITY_INDEX_ENABLED: bool = True
+    AVAILABILITY_INDEX_TTL_SECONDS: int = 60
+    
+    # Analytics read from the daily_stats rollup (backfill it first:
+    # python -m app.scripts.rebuild_daily_stats)
+    ANALYTICS_USE_DAILY_STATS: bool = False
+    
+    # Analytics result cache (LRU, invalidated by booking/inventory commits)
+    ANALYTICS_CACHE_ENABLED: bool = True
+    ANALYTICS_CACHE_MAX_ENTRIES: int = 256
+    ANALYTICS_CACHE_TTL_SECONDS: int = 60
+    
+    # Independent read queries of one request run concurrently on up to
+    # this many pooled connections (1 = sequential on the request session)
+    DB_MAX_PARALLEL_QUERIES: int = 4
+    
+    # Streaming list responses (rows fetched per server-side cursor batch)
+    STREAM_YIELD_PER: int = 500
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
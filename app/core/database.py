@@ -3,27 +3,108 @@ Database configuration with async SQLAlchemy.
 Provides session factory and dependency injection for database access.
 """
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+import asyncio
+from sqlalchemy import event, inspect, make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+from sqlalchemy.sql import Select
+from typing import Any, AsyncGenerator, List, Optional, Sequence
 
 from app.core.config import get_settings
 
 settings = get_settings()
 
-# Create async engine
-# For SQLite, we need check_same_thread=False
-connect_args = {}
-if settings.DATABASE_URL.startswith("sqlite"):
-    connect_args = {"check_same_thread": False}
+def _is_sqlite_memory(url: str) -> bool:
+    return url.startswith("sqlite") and make_url(url).database in (None, "", ":memory:")
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,  # Set to True for SQL debugging
-    connect_args=connect_args if settings.DATABASE_URL.startswith("sqlite") else {}
+
+def _create_engine(url: str, read_only: bool = False) -> AsyncEngine:
+    """
+    Create an async engine with the configured pool settings.
+    
+    Args:
+        url: Database URL
+        read_only: Reject writes on this engine's connections
+    
+    Returns:
+        Async engine
+    """
+    is_sqlite = url.startswith("sqlite")
+    is_sqlite_memory = _is_sqlite_memory(url)
+    
+    # For SQLite, we need check_same_thread=False
+    connect_args = {}
+    server_settings = {}
+    if is_sqlite:
+        connect_args = {"check_same_thread": False}
+    elif url.startswith("postgresql"):
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+        if read_only:
+            server_settings["default_transaction_read_only"] = "on"
+    
+    if server_settings and url.startswith("postgresql+asyncpg"):
+        connect_args = {"server_settings": server_settings}
+    elif server_settings:
+        connect_args = {
+            "options": " ".join(f"-c {name}={value}" for name, value in server_settings.items())
+        }
+    
+    pool_args = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS
+    }
+    if not is_sqlite_memory:
+        # In-memory SQLite uses a single static connection
+        pool_args.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS
+        )
+    
+    new_engine = create_async_engine(
+        url,
+        echo=False,  # Set to True for SQL debugging
+        connect_args=connect_args,
+        **pool_args
+    )
+    
+    if is_sqlite:
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            """
+            Tune every new SQLite connection: WAL lets readers run while a
+            booking transaction writes, busy_timeout waits for the write lock
+            instead of failing with "database is locked".
+            """
+            cursor = dbapi_connection.cursor()
+            if not is_sqlite_memory:
+                cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+            cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+            cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+            cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+            cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+            if read_only:
+                cursor.execute("PRAGMA query_only=ON")
+            cursor.close()
+    
+    return new_engine
+
+
+# Create async engine (primary, all writes)
+engine = _create_engine(settings.DATABASE_URL)
+
+# Optional read-only engine (replica) for read-heavy endpoints;
+# falls back to the primary when READ_DATABASE_URL is not set. The replica
+# is never written (not even create_tables): it must be provisioned from the
+# primary, e.g. by streaming replication or a copy of the SQLite file
+read_engine = (
+    _create_engine(settings.READ_DATABASE_URL, read_only=True)
+    if settings.READ_DATABASE_URL
+    else engine
 )
 
-# Session factory
+# Session factories
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -32,6 +113,18 @@ async_session_maker = async_sessionmaker(
     autoflush=False
 )
 
+read_session_maker = (
+    async_sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False
+    )
+    if read_engine is not engine
+    else async_session_maker
+)
+
 # Base class for all models
 Base = declarative_base()
 
@@ -48,7 +141,118 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a read-only database session.
+    
+    Bound to the replica (READ_DATABASE_URL) when configured, otherwise to
+    the primary. Use only for endpoints that never write; replicas may lag
+    slightly behind the primary.
+    """
+    async with read_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def stream_query(statement: Select, scalars: bool = False) -> AsyncGenerator[Any, None]:
+    """
+    Stream the results of a SELECT using a server-side cursor.
+    
+    Opens its own read session (replica if configured) so the stream can
+    outlive the request-scoped session (StreamingResponse bodies run after
+    dependencies are cleaned up). Rows are fetched in batches of
+    STREAM_YIELD_PER.
+    
+    Args:
+        statement: SELECT statement to execute
+        scalars: Yield the first column of each row instead of the row
+    
+    Yields:
+        Rows (or scalars) as the cursor produces them
+    """
+    statement = statement.execution_options(yield_per=settings.STREAM_YIELD_PER)
+    
+    async with read_session_maker() as session:
+        if scalars:
+            result = await session.stream_scalars(statement)
+        else:
+            result = await session.stream(statement)
+        
+        async for item in result:
+            yield item
+
+
+async def fetch_parallel(
+    db: AsyncSession,
+    statements: Sequence[Select],
+    max_concurrency: Optional[int] = None
+) -> List[List[Any]]:
+    """
+    Run independent SELECTs concurrently, each in its own session.
+    
+    Every statement gets a separate pooled connection from the engine `db`
+    is bound to, so the elapsed time is roughly that of the slowest query
+    instead of the sum. At most `max_concurrency` (default
+    DB_MAX_PARALLEL_QUERIES) statements hold a connection at once, which
+    caps the pool share of a single request.
+    
+    Each statement reads its own snapshot: results are NOT mutually
+    consistent, and every statement costs a pool checkout. Use it only for
+    truly independent reads (figures that are never combined with each
+    other); keep related aggregates in one statement instead. SQLite runs
+    the statements one after another anyway.
+    
+    Args:
+        db: Session whose engine to use
+        statements: SELECT statements to execute
+        max_concurrency: Connections used at most by this call
+    
+    Returns:
+        All rows of each statement, in statement order
+    """
+    limit = max_concurrency or settings.DB_MAX_PARALLEL_QUERIES
+    
+    if limit <= 1 or len(statements) <= 1:
+        return [(await db.execute(statement)).all() for statement in statements]
+    
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def fetch(statement: Select) -> List[Any]:
+        async with semaphore:
+            async with AsyncSession(db.bind, expire_on_commit=False) as session:
+                result = await session.execute(statement)
+                return result.all()
+    
+    return list(await asyncio.gather(*(fetch(statement) for statement in statements)))
+
+
 async def create_tables():
     """Create all database tables. Used for initial setup."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def check_read_replica():
+    """
+    Verify at startup that the read replica has the schema.
+    
+    Raises:
+        RuntimeError: If READ_DATABASE_URL is set but tables are missing
+            (e.g. an empty SQLite file that was never copied from the primary)
+    """
+    if read_engine is engine:
+        return
+    
+    async with read_engine.connect() as conn:
+        table_names = await conn.run_sync(
+            lambda sync_conn: set(inspect(sync_conn).get_table_names())
+        )
+    
+    missing = sorted(set(Base.metadata.tables) - table_names)
+    if missing:
+        raise RuntimeError(
+            f"READ_DATABASE_URL is missing table(s) {', '.join(missing)}; "
+            "provision the replica from the primary database"
+        )
@@ -27,8 +27,14 @@ class InvalidDateRangeError(PMSException):
 
 class InventoryUnavailableError(PMSException):
     """Raised when requested inventory is not available."""
-    def __init__(self, message: str = "Requested inventory is not available", date: str = None):
+    def __init__(
+        self,
+        message: str = "Requested inventory is not available",
+        date: str = None,
+        room_type_id: int = None
+    ):
         self.date = date
+        self.room_type_id = room_type_id
         super().__init__(message)
     
     def to_http_exception(self) -> HTTPException:
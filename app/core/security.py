@@ -2,8 +2,10 @@
 Security utilities for JWT token handling and password hashing.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Optional, TypeVar
 from jose import JWTError, jwt
 import bcrypt
 from fastapi import Depends, HTTPException, status
@@ -11,6 +13,7 @@ from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.core.auth_cache import principal_cache, token_cache
 from app.core.config import get_settings
 from app.core.database import get_db
 
@@ -19,22 +22,98 @@ settings = get_settings()
 # OAuth2 scheme for token extraction from headers
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+T = TypeVar("T")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
+
+class PasswordHashingPool:
+    """
+    Bounded thread pool for bcrypt work.
+    
+    bcrypt takes 100-300 ms per call and releases the GIL, so running it in
+    worker threads keeps the event loop serving other requests. At most
+    `workers` hashes run at once; once `max_queue` calls are waiting or
+    running, new calls are rejected with 503 instead of piling up.
+    """
+    
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hashing"
+        )
+        self.queue_depth = 0  # Calls waiting or running
+        self.peak_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+    
+    async def run(self, func: Callable[..., T], *args) -> T:
+        """Run func(*args) in the pool and wait for the result."""
+        if self.queue_depth >= self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent password checks, please retry",
+                headers={"Retry-After": "1"}
+            )
+        
+        self.queue_depth += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, func, *args)
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.queue_depth -= 1
+        
+        self.completed += 1
+        return result
+    
+    def stats(self) -> dict:
+        """Pool size and queue depth counters."""
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected
+        }
+
+
+password_pool = PasswordHashingPool(
+    settings.PASSWORD_HASH_WORKERS,
+    settings.PASSWORD_HASH_MAX_QUEUE
+)
+
+
+def _checkpw(plain_password: str, hashed_password: str) -> bool:
     password_bytes = plain_password.encode('utf-8')
     hashed_bytes = hashed_password.encode('utf-8')
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
-def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
+def _hashpw(password: str) -> str:
     password_bytes = password.encode('utf-8')
     salt = bcrypt.gensalt()
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
 
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a plain password against a hashed password (in the hashing pool)."""
+    return await password_pool.run(_checkpw, plain_password, hashed_password)
+
+
+async def get_password_hash(password: str) -> str:
+    """Hash a password using bcrypt (in the hashing pool)."""
+    return await password_pool.run(_hashpw, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -59,6 +138,34 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def _verify_token(token: str) -> Optional[str]:
+    """
+    Verify a JWT and return its subject, or None if it is invalid.
+    
+    Tokens verified before are answered from the token cache until they
+    expire.
+    """
+    token_digest = None
+    if settings.TOKEN_CACHE_ENABLED:
+        token_digest = token_cache.digest(token)
+        email = token_cache.get(token_digest)
+        if email is not None:
+            return email
+    
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+    
+    email = payload.get("sub")
+    expires_at = payload.get("exp")
+    
+    if token_digest is not None and email is not None and expires_at is not None:
+        token_cache.put(token_digest, email, expires_at)
+    
+    return email
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
@@ -66,6 +173,10 @@ async def get_current_user(
     """
     Dependency to get the current authenticated user from JWT token.
     
+    Verified tokens and users are cached (see auth_cache), so repeated
+    requests skip JWT verification and the user lookup; is_active is
+    checked on every request.
+    
     Raises:
         HTTPException: If token is invalid or user not found
     """
@@ -75,22 +186,26 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
+    email = _verify_token(token)
+    if email is None:
         raise credentials_exception
     
-    # Import here to avoid circular imports
-    from app.models.user import User
-    
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    user = principal_cache.get(email) if settings.PRINCIPAL_CACHE_ENABLED else None
     
     if user is None:
-        raise credentials_exception
+        # Import here to avoid circular imports
+        from app.models.user import User
+        
+        result = await db.execute(select(User).where(User.email == email))
+        user = result.scalar_one_or_none()
+        
+        if user is None:
+            raise credentials_exception
+        
+        if settings.PRINCIPAL_CACHE_ENABLED:
+            # Detach so the cached instance outlives this request's session
+            db.expunge(user)
+            principal_cache.put(email, user)
     
     if not user.is_active:
         raise HTTPException(
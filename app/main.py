@@ -5,16 +5,18 @@ Main application entry point. Initializes FastAPI app with all routers,
 middleware, and startup events.
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy import select
 
-from app.core.database import create_tables, async_session_maker
+from app.core.database import create_tables, check_read_replica, async_session_maker
 from app.core.config import get_settings
 from app.core.security import get_password_hash
 from app.models.user import User
+from app.services.inventory_maintenance_service import inventory_maintenance_loop
 from app.routers import (
     auth_router,
     room_type_router,
@@ -43,6 +45,9 @@ async def lifespan(app: FastAPI):
     await create_tables()
     print("✅ Database tables created")
     
+    # Reads fail with "no such table" on a replica without the schema
+    await check_read_replica()
+    
     # Seed admin user if not exists
     async with async_session_maker() as session:
         result = await session.execute(
@@ -53,7 +58,7 @@ async def lifespan(app: FastAPI):
         if not admin:
             admin = User(
                 email=settings.ADMIN_EMAIL,
-                hashed_password=get_password_hash(settings.ADMIN_PASSWORD),
+                hashed_password=await get_password_hash(settings.ADMIN_PASSWORD),
                 is_active=True
             )
             session.add(admin)
@@ -62,6 +67,12 @@ async def lifespan(app: FastAPI):
         else:
             print(f"ℹ️  Admin user already exists: {settings.ADMIN_EMAIL}")
     
+    # Keep the inventory horizon rolling in the background
+    maintenance_task = None
+    if settings.INVENTORY_MAINTENANCE_ENABLED:
+        maintenance_task = asyncio.create_task(inventory_maintenance_loop())
+        print("✅ Inventory maintenance scheduled")
+    
     print("🚀 Hotel PMS API is ready!")
     print(f"📚 API docs available at: http://127.0.0.1:8000/docs")
     
@@ -69,6 +80,11 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("👋 Shutting down Hotel PMS API...")
+    
+    if maintenance_task is not None:
+        maintenance_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await maintenance_task
 
 
 # Create FastAPI application
@@ -4,18 +4,22 @@
 from app.models.user import User
 from app.models.room_type import RoomType
 from app.models.inventory import Inventory
+from app.models.inventory_archive import InventoryArchive
 from app.models.customer import Customer
 from app.models.booking import Booking, BookingStatus
 from app.models.booking_item import BookingItem
 from app.models.audit_log import AuditLog
+from app.models.daily_stats import DailyStats
 
 __all__ = [
     "User",
     "RoomType",
     "Inventory",
+    "InventoryArchive",
     "Booking",
     "BookingStatus",
     "BookingItem",
     "Customer",
-    "AuditLog"
+    "AuditLog",
+    "DailyStats"
 ]
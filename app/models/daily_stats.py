@@ -0,0 +1,50 @@
+"""
+DailyStats model: precomputed daily booking rollup per room type.
+"""
+
+from sqlalchemy import Column, Integer, Date, Numeric, UniqueConstraint
+
+from app.core.database import Base
+
+
+class DailyStats(Base):
+    """
+    Daily fact row for one room type, maintained in the same transaction as
+    the booking mutations that change it (see daily_stats_service).
+    
+    Arrival columns attribute a booking to its check-in date; night columns
+    count it on every night of the stay (a per-night ledger), both under
+    the booking's room_type_id.
+    """
+    
+    __tablename__ = "daily_stats"
+    
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False, index=True)
+    room_type_id = Column(Integer, nullable=False, index=True)
+    
+    # Arrivals (bookings checking in on this date)
+    bookings = Column(Integer, nullable=False, default=0)  # All statuses
+    confirmed_bookings = Column(Integer, nullable=False, default=0)
+    cancellations = Column(Integer, nullable=False, default=0)
+    rooms_sold = Column(Integer, nullable=False, default=0)  # Confirmed only
+    room_nights_sold = Column(Integer, nullable=False, default=0)  # Confirmed only
+    revenue = Column(Numeric(12, 2), nullable=False, default=0)  # Confirmed only
+    rooms_reserved = Column(Integer, nullable=False, default=0)  # Not cancelled
+    
+    # Stays (bookings in house on this night)
+    stays = Column(Integer, nullable=False, default=0)  # All statuses
+    confirmed_stays = Column(Integer, nullable=False, default=0)
+    cancelled_stays = Column(Integer, nullable=False, default=0)
+    rooms_occupied = Column(Integer, nullable=False, default=0)  # Confirmed only
+    night_revenue = Column(Numeric(14, 4), nullable=False, default=0)  # total_amount / nights
+    rooms_in_house = Column(Integer, nullable=False, default=0)  # Not cancelled
+    
+    capacity = Column(Integer, nullable=False, default=0)  # Room type total_rooms
+    
+    __table_args__ = (
+        UniqueConstraint('date', 'room_type_id', name='uq_daily_stats_date_room_type'),
+    )
+    
+    def __repr__(self):
+        return f"<DailyStats(date={self.date}, room_type_id={self.room_type_id}, rooms_sold={self.rooms_sold})>"
@@ -0,0 +1,33 @@
+"""
+InventoryArchive model for past-dated inventory moved out of the hot table.
+"""
+
+from sqlalchemy import Column, Integer, Date, Numeric, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class InventoryArchive(Base):
+    """
+    Cold storage for inventory rows whose date has passed.
+    Keeps the (room_type_id, date) index on the inventory table small.
+    """
+    
+    __tablename__ = "inventory_archive"
+    
+    id = Column(Integer, primary_key=True)  # Original inventory ID
+    room_type_id = Column(Integer, nullable=False, index=True)
+    date = Column(Date, nullable=False, index=True)
+    available_rooms = Column(Integer, nullable=False)
+    price = Column(Numeric(10, 2), nullable=False)
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint('room_type_id', 'date', name='uq_archive_room_type_date'),
+    )
+    
+    def __repr__(self):
+        return f"<InventoryArchive(room_type_id={self.room_type_id}, date={self.date}, available={self.available_rooms})>"
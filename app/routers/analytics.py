@@ -7,21 +7,26 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date, timedelta
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.schemas.analytics import (
     OverviewAnalytics,
     RevenueAnalytics,
     RoomTypeAnalytics,
-    BookingTrendAnalytics
+    BookingTrendAnalytics,
+    DashboardAnalytics,
+    AnalyticsCacheStats
 )
 from app.services.analytics_service import (
     get_overview_analytics,
     get_revenue_analytics,
     get_room_type_analytics,
-    get_booking_trend_analytics
+    get_booking_trend_analytics,
+    get_dashboard_analytics
 )
+from app.services.analytics_cache import analytics_cache
+from app.services.daily_stats_service import rebuild_daily_stats
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
@@ -30,7 +35,7 @@ router = APIRouter(prefix="/analytics", tags=["Analytics"])
 async def get_overview(
     start: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end: date = Query(..., description="End date (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -68,14 +73,18 @@ async def get_overview(
 async def get_revenue(
     start: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end: date = Query(..., description="End date (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get date-wise revenue breakdown.
+    Get night-level revenue breakdown.
+    
+    A booking's amount is spread evenly over the nights of the stay, so
+    every night in the range gets its share of revenue, rooms sold,
+    occupancy and ADR.
     
     **Returns:**
-    - Daily revenue array
+    - Daily revenue array (one entry per night in the range)
     - Total revenue
     - Average daily revenue
     
@@ -88,8 +97,10 @@ async def get_revenue(
     ```json
     {
       "daily_revenue": [
-        {"date": "2025-01-01", "revenue": 12000, "booking_count": 5},
-        {"date": "2025-01-02", "revenue": 8500, "booking_count": 3}
+        {"date": "2025-01-01", "revenue": 12000, "booking_count": 5,
+         "rooms_sold": 6, "occupancy_rate": 60.0, "average_daily_rate": 2000.00},
+        {"date": "2025-01-02", "revenue": 8500, "booking_count": 3,
+         "rooms_sold": 4, "occupancy_rate": 40.0, "average_daily_rate": 2125.00}
       ],
       "total_revenue": 280000.00,
       "average_daily_revenue": 9032.26
@@ -104,7 +115,7 @@ async def get_revenue(
 async def get_room_type_performance(
     start: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end: date = Query(..., description="End date (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -144,17 +155,17 @@ async def get_room_type_performance(
 async def get_booking_trends(
     start: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end: date = Query(..., description="End date (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get booking trend analytics.
     
     **Returns:**
-    - Daily booking counts
-    - Daily cancellations
-    - Peak booking day
-    - Total metrics
+    - Bookings in house per night (a stay counts on each of its nights)
+    - Cancelled bookings per night
+    - Peak booking day (busiest night)
+    - Total metrics (bookings checking in within the range)
     
     **Example:**
     ```
@@ -177,3 +188,82 @@ async def get_booking_trends(
     """
     data = await get_booking_trend_analytics(db, start, end)
     return data
+
+
+@router.get("/dashboard", response_model=DashboardAnalytics)
+async def get_dashboard(
+    start: date = Query(..., description="Start date (YYYY-MM-DD)"),
+    end: date = Query(..., description="End date (YYYY-MM-DD)"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get overview, revenue, room type and booking trend analytics together.
+    
+    Same payloads as `/analytics/overview`, `/analytics/revenue`,
+    `/analytics/room-types` and `/analytics/bookings`, computed from a single
+    grouped database scan - one request for the dashboard page.
+    
+    **Example:**
+    ```
+    GET /analytics/dashboard?start=2025-01-01&end=2025-01-31
+    ```
+    
+    **Response:**
+    ```json
+    {
+      "overview": {"total_bookings": 150, ...},
+      "revenue": {"daily_revenue": [...], ...},
+      "room_types": {"room_types": [...], ...},
+      "bookings": {"daily_trends": [...], ...}
+    }
+    ```
+    """
+    data = await get_dashboard_analytics(db, start, end)
+    return data
+
+
+@router.post("/daily-stats/rebuild")
+async def rebuild_stats(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Rebuild the daily_stats rollup from bookings and inventory.
+    
+    Use once before enabling ANALYTICS_USE_DAILY_STATS (backfill), or to
+    repair the rollup after data was changed outside the API.
+    """
+    row_count = await rebuild_daily_stats(db)
+    
+    return {"message": f"Rebuilt daily stats: {row_count} rows"}
+
+
+@router.get("/cache", response_model=AnalyticsCacheStats)
+async def get_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get analytics result cache statistics.
+    
+    Results are cached per (endpoint, start, end) and dropped whenever
+    bookings, inventory or room types change.
+    
+    **Response:**
+    ```json
+    {
+      "enabled": true,
+      "entries": 4,
+      "max_entries": 256,
+      "ttl_seconds": 60,
+      "version": 12,
+      "hits": 76,
+      "misses": 4,
+      "shared": 3,
+      "hit_rate": 95.0,
+      "evictions": 0,
+      "invalidations": 12
+    }
+    ```
+    """
+    return analytics_cache.stats()
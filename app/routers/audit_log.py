@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import date
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.schemas.audit_log import AuditLogRead
@@ -27,7 +27,7 @@ async def list_audit_logs(
     end_date: Optional[date] = Query(None, description="Filter to this date"),
     limit: int = Query(default=100, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(default=0, ge=0, description="Number of results to skip"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
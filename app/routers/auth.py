@@ -9,10 +9,11 @@ from sqlalchemy import select
 from datetime import timedelta
 
 from app.core.database import get_db
-from app.core.security import verify_password, create_access_token, get_current_user
+from app.core.security import verify_password, create_access_token, get_current_user, password_pool
+from app.core.auth_cache import principal_cache, token_cache
 from app.core.config import get_settings
 from app.models.user import User
-from app.schemas.user import Token, LoginRequest, UserRead
+from app.schemas.user import Token, LoginRequest, UserRead, AuthStats
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 settings = get_settings()
@@ -37,7 +38,7 @@ async def login(
     )
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -75,7 +76,7 @@ async def login_json(
     )
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    if not user or not await verify_password(credentials.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -107,3 +108,36 @@ async def get_current_user_info(
     Requires valid JWT token in Authorization header.
     """
     return current_user
+
+
+@router.get("/stats", response_model=AuthStats)
+async def get_auth_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get password hashing pool and authentication cache statistics.
+    
+    Requires valid JWT token in Authorization header.
+    
+    **Response:**
+    ```json
+    {
+      "password_hashing": {
+        "workers": 4,
+        "max_queue": 64,
+        "queue_depth": 0,
+        "peak_queue_depth": 3,
+        "completed": 12,
+        "failed": 0,
+        "rejected": 0
+      },
+      "token_cache": {"entries": 2, "max_entries": 1024, "hits": 40, "misses": 2, "hit_rate": 95.24},
+      "principal_cache": {"entries": 1, "max_entries": 1024, "hits": 41, "misses": 1, "hit_rate": 97.62}
+    }
+    ```
+    """
+    return {
+        "password_hashing": password_pool.stats(),
+        "token_cache": token_cache.stats(),
+        "principal_cache": principal_cache.stats()
+    }
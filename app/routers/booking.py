@@ -10,7 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import get_current_user
 from app.core.exceptions import (
     InvalidDateRangeError,
@@ -30,27 +30,46 @@ from app.services.booking_service import (
     cancel_booking,
     modify_booking,
     get_booking_by_id,
-    booking_to_read_schema
+    booking_to_read_schema,
+    stream_bookings
 )
+from app.services.daily_stats_service import record_booking_change, snapshot_booking
+from app.utils.streaming import ndjson_response, ndjson_responses
 
 router = APIRouter(prefix="/bookings", tags=["Bookings"])
 
 
-@router.get("", response_model=List[BookingRead])
+@router.get(
+    "",
+    response_model=List[BookingRead],
+    responses=ndjson_responses(BookingRead)
+)
 async def list_bookings(
     status_filter: Optional[str] = Query(None, description="Filter by status"),
     from_date: Optional[date] = Query(None, description="Filter by check-in from date"),
     to_date: Optional[date] = Query(None, description="Filter by check-in to date"),
-    limit: int = Query(default=100, ge=1, le=500),
+    limit: Optional[int] = Query(None, ge=1, le=500, description="Max results (default 100; all when streaming)"),
     offset: int = Query(default=0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    stream: bool = Query(False, description="Stream bookings as NDJSON"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     List all bookings. (Protected - requires authentication)
     
     Supports filtering by status and date range.
+    
+    - **stream**: Write one JSON booking per line while reading from the
+      database (constant memory; no limit unless one is given)
     """
+    if stream:
+        return ndjson_response(
+            stream_bookings(status_filter, from_date, to_date, limit, offset)
+        )
+    
+    if limit is None:
+        limit = 100
+    
     query = select(Booking).options(
         selectinload(Booking.customer),
         selectinload(Booking.room_type)
@@ -101,8 +120,8 @@ async def create_new_booking(
     
     This is an ATOMIC TRANSACTION that:
     1. Validates the date range
-    2. Checks room availability for all dates
-    3. Locks inventory rows to prevent race conditions
+    2. Locks inventory rows to prevent race conditions
+    3. Checks room availability for all dates (under the lock)
     4. Reserves inventory (deducts rooms)
     5. Creates or updates customer record
     6. Creates the booking record
@@ -121,11 +140,9 @@ async def create_new_booking(
     - 409: Inventory unavailable (overbooking prevented)
     """
     try:
+        # Returned with customer and room_type already attached
         booking = await create_booking(db, booking_data)
         
-        # Reload with relationships for response
-        booking = await get_booking_by_id(db, booking.id)
-        
         return booking_to_read_schema(booking)
     
     except PMSException as e:
@@ -152,10 +169,15 @@ async def update_booking(
         raise BookingNotFoundError(booking_id).to_http_exception()
     
     # Update fields if provided
+    before = snapshot_booking(booking)
     update_data = booking_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(booking, field, value)
     
+    # Status changes move the booking between rollup buckets
+    if "status" in update_data:
+        await record_booking_change(db, before, snapshot_booking(booking))
+    
     await db.commit()
     await db.refresh(booking)
     
@@ -206,13 +228,14 @@ async def modify_booking_endpoint(
     
     This is an ATOMIC TRANSACTION WITH ROLLBACK that:
     1 Validates the booking can be modified (not cancelled, not in past)
-    2. RESTORES old inventory (rollback original reservation)
-    3. Checks availability for new dates/room type
-    4. RESERVES new inventory (make new reservation)
+    2. Computes the per-night difference between old and new reservation
+    3. RESERVES added nights after checking availability (locked)
+    4. RESTORES nights that are no longer needed
     5. Updates the booking record
     
+    Nights shared by the old and new reservation are left untouched.
     If ANY step fails (especially #3), the ENTIRE transaction rolls back,
-    meaning the original reservation is restored.
+    meaning the original reservation is preserved.
     
     **Allowed modifications:**
     - `check_in`: New check-in date
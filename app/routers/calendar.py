@@ -9,32 +9,49 @@ from fastapi import APIRouter, Depends, Query
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.security import get_current_user
 from app.core.exceptions import InvalidDateRangeError, PMSException
 from app.models.user import User
-from app.schemas.calendar import CalendarAvailability, BookingEvent, CalendarSummary
+from app.schemas.calendar import (
+    CalendarAvailability,
+    CalendarAvailabilityMatrix,
+    BookingEvent,
+    CalendarSummary
+)
 from app.services.calendar_service import (
     get_availability_grid,
+    get_availability_matrix,
     get_booking_events,
-    get_calendar_summary
+    get_calendar_summary,
+    stream_availability_grid,
+    stream_booking_events
 )
+from app.utils.streaming import ndjson_response, ndjson_responses
 
 router = APIRouter(prefix="/calendar", tags=["Calendar"])
 
 
-@router.get("/availability", response_model=List[CalendarAvailability])
+@router.get(
+    "/availability",
+    response_model=List[CalendarAvailability],
+    responses=ndjson_responses(CalendarAvailability)
+)
 async def get_availability(
     start: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end: date = Query(..., description="End date (YYYY-MM-DD)"),
     room_type_id: Optional[int] = Query(None, description="Filter by room type ID"),
-    db: AsyncSession = Depends(get_db),
+    stream: bool = Query(False, description="Stream cells as NDJSON"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get availability grid for calendar view. (Protected - requires authentication)
     
     Returns availability status for each room type on each date.
+    With `stream=true` cells are written one JSON object per line while they
+    are read from the database (constant memory for long ranges). Ranges are
+    limited to CALENDAR_MAX_RANGE_DAYS (default 731) days.
     
     **Status values:**
     - `available`: All rooms available (available_rooms == total_rooms)
@@ -57,18 +74,59 @@ async def get_availability(
     ```
     """
     try:
+        if stream:
+            return ndjson_response(stream_availability_grid(start, end, room_type_id))
         return await get_availability_grid(db, start, end, room_type_id)
     except PMSException as e:
         raise e.to_http_exception()
 
 
-@router.get("/bookings", response_model=List[BookingEvent])
+@router.get("/availability/matrix", response_model=CalendarAvailabilityMatrix)
+async def get_availability_matrix_view(
+    start: date = Query(..., description="Start date (YYYY-MM-DD)"),
+    end: date = Query(..., description="End date (YYYY-MM-DD)"),
+    room_type_id: Optional[int] = Query(None, description="Filter by room type ID"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get the availability grid as compact matrices. (Protected - requires authentication)
+    
+    Same data as `/calendar/availability` in a room type x date layout,
+    suited for long ranges (e.g. a full year, at most CALENDAR_MAX_RANGE_DAYS,
+    default 731 days). Status can be derived per cell from `available` and
+    `total_rooms`.
+    
+    **Response format:**
+    ```json
+    {
+      "start_date": "2025-01-20",
+      "end_date": "2025-01-22",
+      "dates": ["2025-01-20", "2025-01-21"],
+      "room_types": [{"id": 1, "name": "Deluxe", "total_rooms": 5}],
+      "available": [[3, 5]],
+      "prices": [["150.00", "150.00"]]
+    }
+    ```
+    """
+    try:
+        return await get_availability_matrix(db, start, end, room_type_id)
+    except PMSException as e:
+        raise e.to_http_exception()
+
+
+@router.get(
+    "/bookings",
+    response_model=List[BookingEvent],
+    responses=ndjson_responses(BookingEvent)
+)
 async def get_bookings(
     start: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end: date = Query(..., description="End date (YYYY-MM-DD)"),
     room_type_id: Optional[int] = Query(None, description="Filter by room type ID"),
     include_cancelled: bool = Query(False, description="Include cancelled bookings"),
-    db: AsyncSession = Depends(get_db),
+    stream: bool = Query(False, description="Stream events as NDJSON"),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -76,6 +134,7 @@ async def get_bookings(
     
     Returns booking blocks that can be rendered on a calendar.
     Includes all bookings that overlap with the date range.
+    With `stream=true` events are written one JSON object per line.
     
     **Response format:**
     ```json
@@ -95,6 +154,10 @@ async def get_bookings(
     ```
     """
     try:
+        if stream:
+            return ndjson_response(
+                stream_booking_events(start, end, room_type_id, include_cancelled)
+            )
         return await get_booking_events(db, start, end, room_type_id, include_cancelled)
     except PMSException as e:
         raise e.to_http_exception()
@@ -104,7 +167,7 @@ async def get_bookings(
 async def get_summary(
     start: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end: date = Query(..., description="End date (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -6,15 +6,25 @@ from datetime import date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.inventory import Inventory
 from app.models.room_type import RoomType
-from app.schemas.inventory import InventoryRead, InventoryUpdate, DateRangeAvailability
-from app.services.inventory_service import get_availability_summary, generate_inventory_for_room_type
+from app.core.exceptions import PMSException
+from app.schemas.inventory import InventoryRead, InventoryUpdate, DateRangeAvailability, AvailableStay
+from app.services.availability_index import availability_index
+from app.utils.streaming import ndjson_response, ndjson_responses
+from app.services.inventory_service import (
+    get_availability_summary,
+    get_detailed_inventory,
+    stream_detailed_inventory,
+    search_available_stays,
+    generate_inventory_for_room_type,
+    generate_inventory_for_all_room_types
+)
 
 router = APIRouter(prefix="/inventory", tags=["Inventory"])
 
@@ -24,7 +34,7 @@ async def get_inventory(
     start: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end: date = Query(..., description="End date (YYYY-MM-DD)"),
     room_type_id: Optional[int] = Query(None, description="Filter by room type ID"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get inventory availability for a date range.
@@ -44,17 +54,56 @@ async def get_inventory(
     return await get_availability_summary(db, start, end, room_type_id)
 
 
-@router.get("/detailed", response_model=List[InventoryRead])
-async def get_detailed_inventory(
+@router.get("/search", response_model=List[AvailableStay])
+async def search_inventory(
+    check_in: date = Query(..., description="Preferred check-in date (YYYY-MM-DD)"),
+    nights: int = Query(..., ge=1, le=30, description="Length of stay"),
+    num_rooms: int = Query(default=1, ge=1, le=10, description="Rooms needed"),
+    flex_days: int = Query(default=7, ge=0, le=30, description="Days to search before/after check-in"),
+    room_type_id: Optional[int] = Query(None, description="Filter by room type ID"),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Search for available stays around a preferred check-in date.
+    
+    Returns the cheapest bookable (room type, check-in) combinations within
+    ±flex_days of the requested date, so a client can offer alternatives
+    when a booking attempt fails.
+    
+    - **check_in**: Preferred check-in date
+    - **nights**: Number of nights
+    - **num_rooms**: Number of rooms needed
+    - **flex_days**: Allowed shift of the check-in date (default: 7)
+    - **room_type_id**: Optional filter for specific room type
+    """
+    try:
+        return await search_available_stays(
+            db, check_in, nights, num_rooms, flex_days, room_type_id, limit
+        )
+    except PMSException as e:
+        raise e.to_http_exception()
+
+
+@router.get(
+    "/detailed",
+    response_model=List[InventoryRead],
+    responses=ndjson_responses(InventoryRead)
+)
+async def get_detailed_inventory_records(
     start: date = Query(..., description="Start date (YYYY-MM-DD)"),
     end: date = Query(..., description="End date (YYYY-MM-DD)"),
     room_type_id: Optional[int] = Query(None, description="Filter by room type ID"),
-    db: AsyncSession = Depends(get_db)
+    stream: bool = Query(False, description="Stream records as NDJSON"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get detailed daily inventory records.
     
     Returns individual inventory records for each date and room type.
+    
+    - **stream**: Write one JSON record per line while reading from the
+      database (constant memory, for exports over long ranges)
     """
     if end <= start:
         raise HTTPException(
@@ -62,36 +111,10 @@ async def get_detailed_inventory(
             detail="End date must be after start date"
         )
     
-    query = select(Inventory).where(
-        and_(
-            Inventory.date >= start,
-            Inventory.date < end
-        )
-    )
-    
-    if room_type_id:
-        query = query.where(Inventory.room_type_id == room_type_id)
-    
-    query = query.order_by(Inventory.date, Inventory.room_type_id)
-    
-    result = await db.execute(query)
-    inventories = result.scalars().all()
-    
-    # Get room type names for response
-    room_types_result = await db.execute(select(RoomType))
-    room_types = {rt.id: rt.name for rt in room_types_result.scalars().all()}
+    if stream:
+        return ndjson_response(stream_detailed_inventory(start, end, room_type_id))
     
-    return [
-        InventoryRead(
-            id=inv.id,
-            room_type_id=inv.room_type_id,
-            room_type_name=room_types.get(inv.room_type_id),
-            date=inv.date,
-            available_rooms=inv.available_rooms,
-            price=inv.price
-        )
-        for inv in inventories
-    ]
+    return await get_detailed_inventory(db, start, end, room_type_id)
 
 
 @router.put("/{inventory_id}", response_model=InventoryRead)
@@ -122,6 +145,13 @@ async def update_inventory(
     for field, value in update_data.items():
         setattr(inventory, field, value)
     
+    availability_index.record_set(
+        db,
+        inventory.room_type_id,
+        inventory.date,
+        inventory.available_rooms,
+        inventory.price
+    )
     await db.commit()
     await db.refresh(inventory)
     
@@ -141,6 +171,24 @@ async def update_inventory(
     )
 
 
+@router.post("/generate", status_code=status.HTTP_201_CREATED)
+async def regenerate_all_inventory(
+    days_ahead: int = Query(default=90, ge=1, le=365),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Regenerate inventory for all room types. (Protected - requires authentication)
+    
+    Generates inventory for missing dates (does not overwrite existing).
+    
+    - **days_ahead**: Number of days to generate (default: 90, max: 365)
+    """
+    created_count = await generate_inventory_for_all_room_types(db, days_ahead)
+    
+    return {"message": f"Created {created_count} new inventory records"}
+
+
 @router.post("/generate/{room_type_id}", status_code=status.HTTP_201_CREATED)
 async def regenerate_inventory(
     room_type_id: int,
@@ -12,6 +12,8 @@ from app.core.security import get_current_user
 from app.models.user import User
 from app.models.room_type import RoomType
 from app.schemas.room_type import RoomTypeCreate, RoomTypeRead, RoomTypeUpdate
+from app.services.availability_index import availability_index
+from app.services.daily_stats_service import update_capacity, delete_room_type_stats
 from app.services.inventory_service import generate_inventory_for_room_type
 
 router = APIRouter(prefix="/room-types", tags=["Room Types"])
@@ -124,6 +126,10 @@ async def update_room_type(
     for field, value in update_data.items():
         setattr(room_type, field, value)
     
+    if "total_rooms" in update_data:
+        await update_capacity(db, room_type.id, room_type.total_rooms)
+    
+    availability_index.record_invalidate(db)
     await db.commit()
     await db.refresh(room_type)
     
@@ -160,5 +166,7 @@ async def delete_room_type(
             detail="Cannot delete room type with existing bookings"
         )
     
+    await delete_room_type_stats(db, room_type.id)
     await db.delete(room_type)
+    availability_index.record_invalidate(db)
     await db.commit()
@@ -22,10 +22,13 @@ class OverviewAnalytics(BaseModel):
 
 
 class DailyRevenue(BaseModel):
-    """Revenue for a single day."""
+    """Revenue earned on a single night (stays spread over their nights)."""
     date: date
     revenue: Decimal
-    booking_count: int
+    booking_count: int  # Confirmed bookings in house
+    rooms_sold: int = 0
+    occupancy_rate: float = 0  # Percentage
+    average_daily_rate: Decimal = Decimal(0)  # ADR
 
 
 class RevenueAnalytics(BaseModel):
@@ -55,9 +58,9 @@ class RoomTypeAnalytics(BaseModel):
 
 
 class DailyBookingTrend(BaseModel):
-    """Booking trend for a single day."""
+    """Booking trend for a single night."""
     date: date
-    bookings: int
+    bookings: int  # Bookings in house (all statuses)
     cancellations: int
 
 
@@ -70,3 +73,31 @@ class BookingTrendAnalytics(BaseModel):
     peak_booking_count: int
     total_bookings: int
     total_cancellations: int
+
+
+
+class DashboardAnalytics(BaseModel):
+    """
+    All dashboard analytics for one date range (single database pass).
+    """
+    overview: OverviewAnalytics
+    revenue: RevenueAnalytics
+    room_types: RoomTypeAnalytics
+    bookings: BookingTrendAnalytics
+
+
+class AnalyticsCacheStats(BaseModel):
+    """
+    Analytics result cache counters.
+    """
+    enabled: bool
+    entries: int
+    max_entries: int
+    ttl_seconds: int
+    version: int
+    hits: int
+    misses: int
+    shared: int  # Waited on another request's computation
+    hit_rate: float  # Percentage
+    evictions: int
+    invalidations: int
@@ -4,7 +4,7 @@ Pydantic schemas for calendar API responses.
 
 from pydantic import BaseModel, Field
 from datetime import date
-from typing import Literal
+from typing import List, Literal, Optional
 from decimal import Decimal
 
 
@@ -25,6 +25,27 @@ class CalendarAvailability(BaseModel):
         from_attributes = True
 
 
+class MatrixRoomType(BaseModel):
+    """Row header of the compact availability matrix."""
+    id: int
+    name: str
+    total_rooms: int
+
+
+class CalendarAvailabilityMatrix(BaseModel):
+    """
+    Compact availability grid: one row per room type, one column per date.
+    available[i][j] and prices[i][j] belong to room_types[i] on dates[j]
+    (null when no inventory exists for that day).
+    """
+    start_date: date
+    end_date: date
+    dates: List[date]
+    room_types: List[MatrixRoomType]
+    available: List[List[Optional[int]]]
+    prices: List[List[Optional[Decimal]]]
+
+
 class BookingEvent(BaseModel):
     """
     Calendar event block representing a booking.
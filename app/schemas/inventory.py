@@ -56,3 +56,16 @@ class DateRangeAvailability(BaseModel):
     min_available: int
     total_price: Decimal
     daily_breakdown: List[InventoryAvailability]
+
+
+class AvailableStay(BaseModel):
+    """A bookable stay returned by the flexible availability search."""
+    room_type_id: int
+    room_type_name: str
+    check_in: date
+    check_out: date
+    num_nights: int
+    num_rooms: int
+    min_available: int
+    total_price: Decimal
+    days_from_requested: int
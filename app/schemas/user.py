@@ -42,3 +42,30 @@ class LoginRequest(BaseModel):
     """Login request with email and password."""
     email: EmailStr
     password: str
+
+
+class PasswordHashingStats(BaseModel):
+    """Password hashing pool counters."""
+    workers: int
+    max_queue: int
+    queue_depth: int
+    peak_queue_depth: int
+    completed: int
+    failed: int  # Raised (e.g. malformed hash) or cancelled
+    rejected: int  # Queue full (503)
+
+
+class AuthCacheStats(BaseModel):
+    """Token or principal cache counters."""
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    hit_rate: float  # Percentage
+
+
+class AuthStats(BaseModel):
+    """Authentication performance counters."""
+    password_hashing: PasswordHashingStats
+    token_cache: AuthCacheStats
+    principal_cache: AuthCacheStats
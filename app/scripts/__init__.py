@@ -0,0 +1 @@
+# Scripts module initialization
@@ -0,0 +1,22 @@
+"""
+Rebuild the daily_stats rollup from bookings and inventory (backfill).
+
+Usage:
+    python -m app.scripts.rebuild_daily_stats
+"""
+
+import asyncio
+
+from app.core.database import async_session_maker, create_tables
+from app.services.daily_stats_service import rebuild_daily_stats
+
+
+async def main() -> None:
+    await create_tables()
+    async with async_session_maker() as db:
+        count = await rebuild_daily_stats(db)
+    print(f"📊 Rebuilt daily_stats: {count} rows")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
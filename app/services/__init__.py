@@ -3,10 +3,16 @@
 from app.services.inventory_service import (
     generate_inventory,
     generate_inventory_for_room_type,
+    generate_inventory_for_all_room_types,
     get_inventory_for_date_range,
-    check_availability,
+    search_available_stays,
     reserve_inventory,
+    reserve_inventory_multi,
     restore_inventory,
+    diff_stay_inventory,
+    apply_inventory_changes,
+    get_stay_price,
+    get_room_types_by_ids,
     get_availability_summary
 )
 from app.services.booking_service import (
@@ -22,10 +28,16 @@ __all__ = [
     # Inventory
     "generate_inventory",
     "generate_inventory_for_room_type",
+    "generate_inventory_for_all_room_types",
     "get_inventory_for_date_range",
-    "check_availability",
+    "search_available_stays",
     "reserve_inventory",
+    "reserve_inventory_multi",
     "restore_inventory",
+    "diff_stay_inventory",
+    "apply_inventory_changes",
+    "get_stay_price",
+    "get_room_types_by_ids",
     "get_availability_summary",
     # Booking
     "create_booking",
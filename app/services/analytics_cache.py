@@ -0,0 +1,231 @@
+"""
+In-process result cache for the analytics endpoints.
+
+Dashboards request the same (endpoint, start, end) combinations over and over
+from many terminals; the cache answers repeats from memory instead of
+re-running the aggregates.
+
+- Keyed by (function name, start, end), bounded, least recently used
+  entries are evicted first
+- Concurrent misses for the same key share one computation; if the request
+  running it is cancelled (client disconnect), a waiter runs it again on its
+  own session
+- A version counter is bumped after every COMMIT that changed bookings,
+  inventory, room types or the daily_stats rollup; bumping drops all entries
+- Entries also expire after ANALYTICS_CACHE_TTL_SECONDS to bound staleness
+  when several worker processes write to the same database
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+_DIRTY_KEY = "analytics_cache_dirty"
+
+# Tables whose changes can alter analytics results
+_TRACKED_TABLES = frozenset({
+    "bookings",
+    "booking_items",
+    "inventory",
+    "inventory_archive",
+    "room_types",
+    "daily_stats"
+})
+
+
+class AnalyticsCache:
+    """Process-wide LRU cache of analytics results."""
+    
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+    
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached result for key, computing it on a miss.
+        
+        Args:
+            key: Cache key
+            compute: Coroutine factory producing the result
+        
+        Returns:
+            Cached or freshly computed result
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            if time.monotonic() - stored_at < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        
+        # Another request is already computing this result
+        in_flight = self._in_flight.get(key)
+        while in_flight is not None:
+            self.shared += 1
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                # Only retry when the computing request was cancelled, not this one
+                if not in_flight.cancelled():
+                    raise
+            in_flight = self._in_flight.get(key)
+        
+        self.misses += 1
+        version = self._version
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            # Waiters see a cancelled future and compute it themselves
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve it so an unawaited future does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+        
+        # A commit during the computation may have changed the data
+        if version == self._version:
+            self._store(key, value)
+        
+        return value
+    
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    # -------------------------------------------------------------------------
+    # Invalidation
+    # -------------------------------------------------------------------------
+    
+    def invalidate(self) -> None:
+        """Bump the version and drop all entries."""
+        self._version += 1
+        self._entries.clear()
+        # Results still being computed may predate the change
+        self._in_flight.clear()
+        self.invalidations += 1
+    
+    def mark_dirty(self, session: Session) -> None:
+        """Record that the session changed analytics data (applied on commit)."""
+        session.info[_DIRTY_KEY] = True
+    
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+    
+    def stats(self) -> dict:
+        """Hit/miss counters and current size (shared: waits on an in-flight computation)."""
+        lookups = self.hits + self.misses
+        
+        return {
+            "enabled": settings.ANALYTICS_CACHE_ENABLED,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "version": self._version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+
+analytics_cache = AnalyticsCache(
+    settings.ANALYTICS_CACHE_MAX_ENTRIES,
+    settings.ANALYTICS_CACHE_TTL_SECONDS
+)
+
+
+def cached_analytics(func):
+    """
+    Serve an analytics function (db, start_date, end_date) from the cache.
+    
+    The database session is not part of the key.
+    """
+    @functools.wraps(func)
+    async def wrapper(db, start_date, end_date):
+        if not settings.ANALYTICS_CACHE_ENABLED:
+            return await func(db, start_date, end_date)
+        
+        return await analytics_cache.get_or_compute(
+            (func.__name__, start_date, end_date),
+            lambda: func(db, start_date, end_date)
+        )
+    
+    return wrapper
+
+
+# =============================================================================
+# SESSION EVENTS
+# =============================================================================
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_changes(session: Session, flush_context) -> None:
+    """Mark the session dirty when flushed ORM objects touch tracked tables."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if getattr(obj, "__tablename__", None) in _TRACKED_TABLES:
+            analytics_cache.mark_dirty(session)
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_statements(orm_execute_state) -> None:
+    """Mark the session dirty for INSERT/UPDATE/DELETE statements on tracked tables."""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) in _TRACKED_TABLES:
+        analytics_cache.mark_dirty(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    """Bump the cache version once the changes are durable."""
+    if session.info.pop(_DIRTY_KEY, False):
+        analytics_cache.invalidate()
@@ -1,20 +1,51 @@
 """
 Analytics service - all analytics calculations happen here.
-Uses SQL aggregations for performance.
+Uses SQL aggregations for performance. Revenue and booking trends are
+night-level: stays are expanded against a generated date series in SQL.
+
+With ANALYTICS_USE_DAILY_STATS enabled every endpoint reads the daily_stats
+rollup (see daily_stats_service) instead of scanning bookings and inventory:
+capacity comes from its capacity column, and rooms left to sell are capacity
+minus the rooms of non-cancelled stays (manual inventory overrides are not
+reflected).
+
+Results are cached per (function, start, end) in analytics_cache.
 """
 
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import List, Tuple
+from typing import Dict, List, NamedTuple, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, case
+from sqlalchemy import select, func, and_, case, literal, union_all
 
+from app.core.config import get_settings
 from app.models.booking import Booking, BookingStatus
 from app.models.booking_item import BookingItem
+from app.models.daily_stats import DailyStats
 from app.models.inventory import Inventory
+from app.models.inventory_archive import InventoryArchive
 from app.models.room_type import RoomType
+from app.services.analytics_cache import cached_analytics
+from app.services.daily_stats_service import BOOKING_STAT_COLUMNS, sql_night_revenue
+from app.utils.date_utils import get_date_range, sql_days_between, sql_date_series
+
+settings = get_settings()
+
+CENT = Decimal("0.01")
+
+
+def _in_range(start_date: date, end_date: date):
+    """Rollup rows whose date falls in [start_date, end_date]."""
+    return and_(DailyStats.date >= start_date, DailyStats.date <= end_date)
 
 
+def _rollup_available_rooms():
+    """Rooms left to sell on a rollup row (capacity minus rooms in house)."""
+    remaining = DailyStats.capacity - DailyStats.rooms_in_house
+    return case((remaining > 0, remaining), else_=0)
+
+
+@cached_analytics
 async def get_overview_analytics(
     db: AsyncSession,
     start_date: date,
@@ -23,6 +54,10 @@ async def get_overview_analytics(
     """
     Calculate high-level KPIs: bookings, revenue, occupancy, ADR.
     
+    Computed in one statement, so the booking totals and the capacity come
+    from the same snapshot; room nights are summed in SQL as
+    num_rooms * (check_out - check_in) with dialect-aware date arithmetic.
+    
     Args:
         db: Database session
         start_date: Start of date range
@@ -31,62 +66,90 @@ async def get_overview_analytics(
     Returns:
         Dictionary with overview metrics
     """
-    # Total bookings and breakdown by status
-    result = await db.execute(
-        select(
-            func.count(Booking.id).label('total'),
-            func.sum(case((Booking.status == BookingStatus.CONFIRMED.value, 1), else_=0)).label('confirmed'),
-            func.sum(case((Booking.status == BookingStatus.CANCELLED.value, 1), else_=0)).label('cancelled'),
-            func.sum(case((Booking.status == BookingStatus.CONFIRMED.value, Booking.total_amount), else_=0)).label('revenue')
-        ).where(
+    if settings.ANALYTICS_USE_DAILY_STATS:
+        return await _overview_from_daily_stats(db, start_date, end_date)
+    
+    confirmed = Booking.status == BookingStatus.CONFIRMED.value
+    nights = sql_days_between(db.get_bind().dialect.name, Booking.check_in, Booking.check_out)
+    
+    # Total available room nights from inventory
+    inventory_capacity = (
+        select(func.sum(Inventory.available_rooms))
+        .where(
             and_(
-                Booking.check_in >= start_date,
-                Booking.check_in <= end_date
+                Inventory.date >= start_date,
+                Inventory.date <= end_date
             )
         )
+        .scalar_subquery()
     )
-    stats = result.one()
     
-    total_bookings = stats.total or 0
-    confirmed = stats.confirmed or 0
-    cancelled = stats.cancelled or 0
-    total_revenue = Decimal(stats.revenue or 0)
-    
-    # Calculate room nights sold (only confirmed bookings)
-    # Query all confirmed bookings to calculate nights in Python
+    # Bookings by status, revenue and room nights sold (confirmed only)
+    # in a single statement
     result = await db.execute(
         select(
-            Booking.num_rooms,
-            Booking.check_in,
-            Booking.check_out
+            func.count(Booking.id).label('total'),
+            func.sum(case((confirmed, 1), else_=0)).label('confirmed'),
+            func.sum(case((Booking.status == BookingStatus.CANCELLED.value, 1), else_=0)).label('cancelled'),
+            func.sum(case((confirmed, Booking.total_amount), else_=0)).label('revenue'),
+            func.sum(case((confirmed, Booking.num_rooms * nights), else_=0)).label('room_nights'),
+            inventory_capacity.label('total_capacity')
         ).where(
             and_(
                 Booking.check_in >= start_date,
-                Booking.check_in <= end_date,
-                Booking.status == BookingStatus.CONFIRMED.value
+                Booking.check_in <= end_date
             )
         )
     )
     
-    room_nights_sold = 0
-    for row in result:
-        nights = (row.check_out - row.check_in).days
-        room_nights_sold += row.num_rooms * nights
-    
-    # Calculate total available room nights from inventory
+    return _overview_row_metrics(result.one())
+
+
+async def _overview_from_daily_stats(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date
+) -> dict:
+    """Overview KPIs and capacity from the daily_stats rollup (one range scan)."""
     result = await db.execute(
         select(
-            func.count(Inventory.id).label('inventory_records'),
-            func.sum(Inventory.available_rooms).label('total_capacity')
-        ).where(
-            and_(
-                Inventory.date >= start_date,
-                Inventory.date <= end_date
-            )
-        )
+            func.sum(DailyStats.bookings).label('total'),
+            func.sum(DailyStats.confirmed_bookings).label('confirmed'),
+            func.sum(DailyStats.cancellations).label('cancelled'),
+            func.sum(DailyStats.revenue).label('revenue'),
+            func.sum(DailyStats.room_nights_sold).label('room_nights'),
+            func.sum(_rollup_available_rooms()).label('total_capacity')
+        ).where(_in_range(start_date, end_date))
+    )
+    
+    return _overview_row_metrics(result.one())
+
+
+def _overview_row_metrics(stats) -> dict:
+    """
+    Overview metrics from one aggregate row
+    (total, confirmed, cancelled, revenue, room_nights, total_capacity).
+    """
+    return _overview_metrics(
+        stats.total or 0,
+        stats.confirmed or 0,
+        stats.cancelled or 0,
+        Decimal(stats.revenue or 0),
+        stats.room_nights or 0,
+        stats.total_capacity
     )
-    inv_stats = result.one()
-    total_room_nights = inv_stats.total_capacity or 1  # Avoid division by zero
+
+
+def _overview_metrics(
+    total_bookings: int,
+    confirmed: int,
+    cancelled: int,
+    total_revenue: Decimal,
+    room_nights_sold: int,
+    total_capacity
+) -> dict:
+    """Derive ADR and occupancy from the overview aggregates."""
+    total_room_nights = total_capacity or 1  # Avoid division by zero
     
     # Calculate metrics
     adr = total_revenue / Decimal(room_nights_sold) if room_nights_sold > 0 else Decimal(0)
@@ -102,13 +165,20 @@ async def get_overview_analytics(
     }
 
 
+@cached_analytics
 async def get_revenue_analytics(
     db: AsyncSession,
     start_date: date,
     end_date: date
 ) -> dict:
     """
-    Calculate daily revenue breakdown.
+    Calculate nightly revenue, occupancy and ADR.
+    
+    Each confirmed booking contributes total_amount / nights to every night
+    it is in house, so long stays are spread over their nights instead of
+    landing on the check-in date. Stays are expanded against a generated
+    date series in SQL and aggregated in one statement; every night of the
+    range is returned, including nights without revenue.
     
     Args:
         db: Database session
@@ -118,32 +188,82 @@ async def get_revenue_analytics(
     Returns:
         Dictionary with daily revenue data
     """
-    # Daily revenue grouped by check-in date
-    result = await db.execute(
+    dialect_name = db.get_bind().dialect.name
+    series = sql_date_series(dialect_name, start_date, end_date)
+    
+    if settings.ANALYTICS_USE_DAILY_STATS:
+        # Night columns and capacity of the rollup
+        nightly = (
+            select(
+                DailyStats.date.label('night'),
+                func.sum(DailyStats.night_revenue).label('revenue'),
+                func.sum(DailyStats.confirmed_stays).label('booking_count'),
+                func.sum(DailyStats.rooms_occupied).label('rooms_sold'),
+                func.sum(DailyStats.capacity).label('capacity')
+            ).where(_in_range(start_date, end_date))
+            .group_by(DailyStats.date)
+            .subquery()
+        )
+        capacity = nightly
+    else:
+        # Confirmed stays expanded to nights
+        nights = sql_days_between(dialect_name, Booking.check_in, Booking.check_out)
+        nightly = (
+            select(
+                series.c.night,
+                func.sum(sql_night_revenue(dialect_name, nights)).label('revenue'),
+                func.count(Booking.id).label('booking_count'),
+                func.sum(Booking.num_rooms).label('rooms_sold')
+            ).select_from(series)
+            .join(Booking, _in_house(series.c.night))
+            .where(
+                and_(
+                    Booking.check_in <= end_date,
+                    Booking.check_out > start_date,
+                    Booking.status == BookingStatus.CONFIRMED.value
+                )
+            ).group_by(series.c.night)
+            .subquery()
+        )
+        capacity = _nightly_capacity(start_date, end_date)
+    
+    stmt = (
         select(
-            Booking.check_in,
-            func.sum(Booking.total_amount).label('revenue'),
-            func.count(Booking.id).label('booking_count')
-        ).where(
-            and_(
-                Booking.check_in >= start_date,
-                Booking.check_in <= end_date,
-                Booking.status == BookingStatus.CONFIRMED.value
-            )
-        ).group_by(Booking.check_in)
-        .order_by(Booking.check_in)
+            series.c.night,
+            nightly.c.revenue,
+            nightly.c.booking_count,
+            nightly.c.rooms_sold,
+            capacity.c.capacity
+        ).select_from(series)
+        .outerjoin(nightly, nightly.c.night == series.c.night)
     )
+    if capacity is not nightly:
+        stmt = stmt.outerjoin(capacity, capacity.c.night == series.c.night)
+    
+    result = await db.execute(stmt.order_by(series.c.night))
     
+    return _revenue_payload(result)
+
+
+def _revenue_payload(rows) -> dict:
+    """
+    Build the revenue response from per-night rows
+    (night, revenue, booking_count, rooms_sold, capacity).
+    """
     daily_data = []
     total_revenue = Decimal(0)
     
-    for row in result:
-        revenue = Decimal(row.revenue or 0)
+    for row in rows:
+        revenue = _to_cents(row.revenue)
+        rooms_sold = row.rooms_sold or 0
         total_revenue += revenue
         daily_data.append({
-            "date": row.check_in,
+            "date": row.night,
             "revenue": revenue,
-            "booking_count": row.booking_count
+            "booking_count": row.booking_count or 0,
+            "rooms_sold": rooms_sold,
+            "occupancy_rate": round(rooms_sold / row.capacity * 100, 2) if row.capacity else 0,
+            "average_daily_rate": round(revenue / rooms_sold, 2) if rooms_sold else Decimal("0.00")
         })
     
     avg_daily = total_revenue / len(daily_data) if daily_data else Decimal(0)
@@ -155,6 +275,41 @@ async def get_revenue_analytics(
     }
 
 
+def _in_house(night):
+    """Join condition: the booking occupies rooms on the given night."""
+    return and_(Booking.check_in <= night, Booking.check_out > night)
+
+
+def _nightly_capacity(start_date: date, end_date: date):
+    """
+    Subquery of sellable rooms per night: total_rooms of every room type
+    with (live or archived) inventory on that date.
+    """
+    inventory_dates = union_all(
+        select(Inventory.date.label('night'), Inventory.room_type_id)
+        .where(and_(Inventory.date >= start_date, Inventory.date <= end_date)),
+        select(InventoryArchive.date, InventoryArchive.room_type_id)
+        .where(and_(InventoryArchive.date >= start_date, InventoryArchive.date <= end_date))
+    ).subquery()
+    
+    return (
+        select(
+            inventory_dates.c.night,
+            func.sum(RoomType.total_rooms).label('capacity')
+        ).join(RoomType, RoomType.id == inventory_dates.c.room_type_id)
+        .group_by(inventory_dates.c.night)
+        .subquery()
+    )
+
+
+def _to_cents(value) -> Decimal:
+    """Round a (possibly float) SQL sum to a money amount."""
+    if value is None:
+        return Decimal("0.00")
+    return Decimal(str(value)).quantize(CENT)
+
+
+@cached_analytics
 async def get_room_type_analytics(
     db: AsyncSession,
     start_date: date,
@@ -171,28 +326,52 @@ async def get_room_type_analytics(
     Returns:
         Dictionary with room type performance data
     """
-    # Aggregate by room type
-    result = await db.execute(
-        select(
-            RoomType.id,
-            RoomType.name,
-            func.sum(Booking.num_rooms).label('rooms_booked'),
-            func.sum(Booking.total_amount).label('revenue')
-        ).join(
-            Booking, Booking.room_type_id == RoomType.id
-        ).where(
-            and_(
-                Booking.check_in >= start_date,
-                Booking.check_in <= end_date,
-                Booking.status == BookingStatus.CONFIRMED.value
-            )
-        ).group_by(RoomType.id, RoomType.name)
-    )
+    if settings.ANALYTICS_USE_DAILY_STATS:
+        # Aggregate the rollup by room type
+        result = await db.execute(
+            select(
+                RoomType.id,
+                RoomType.name,
+                func.sum(DailyStats.rooms_sold).label('rooms_booked'),
+                func.sum(DailyStats.revenue).label('revenue')
+            ).join(
+                DailyStats, DailyStats.room_type_id == RoomType.id
+            ).where(_in_range(start_date, end_date))
+            .group_by(RoomType.id, RoomType.name)
+            .having(func.sum(DailyStats.confirmed_bookings) > 0)
+            .order_by(RoomType.id)
+        )
+    else:
+        # Aggregate by room type
+        result = await db.execute(
+            select(
+                RoomType.id,
+                RoomType.name,
+                func.sum(Booking.num_rooms).label('rooms_booked'),
+                func.sum(Booking.total_amount).label('revenue')
+            ).join(
+                Booking, Booking.room_type_id == RoomType.id
+            ).where(
+                and_(
+                    Booking.check_in >= start_date,
+                    Booking.check_in <= end_date,
+                    Booking.status == BookingStatus.CONFIRMED.value
+                )
+            ).group_by(RoomType.id, RoomType.name)
+        )
     
+    return _room_type_payload(result)
+
+
+def _room_type_payload(rows) -> dict:
+    """
+    Build the room type response from per-room-type rows
+    (id, name, rooms_booked, revenue).
+    """
     room_types_data = []
     total_revenue = Decimal(0)
     
-    for row in result:
+    for row in rows:
         revenue = Decimal(row.revenue or 0)
         total_revenue += revenue
         room_types_data.append({
@@ -216,13 +395,18 @@ async def get_room_type_analytics(
     }
 
 
+@cached_analytics
 async def get_booking_trend_analytics(
     db: AsyncSession,
     start_date: date,
     end_date: date
 ) -> dict:
     """
-    Calculate booking trends: bookings and cancellations per day.
+    Calculate booking trends: bookings in house and cancellations per night.
+    
+    Nightly figures count a booking on every night of its stay (expanded
+    against a generated date series in SQL); the peak is the busiest night.
+    Totals count bookings by check-in date, like the overview.
     
     Args:
         db: Database session
@@ -232,40 +416,76 @@ async def get_booking_trend_analytics(
     Returns:
         Dictionary with booking trend data
     """
-    # Daily bookings and cancellations
-    result = await db.execute(
-        select(
-            Booking.check_in,
-            func.count(Booking.id).label('total_bookings'),
-            func.sum(case((Booking.status == BookingStatus.CANCELLED.value, 1), else_=0)).label('cancellations')
-        ).where(
-            and_(
-                Booking.check_in >= start_date,
-                Booking.check_in <= end_date
-            )
-        ).group_by(Booking.check_in)
-        .order_by(Booking.check_in)
-    )
+    series = sql_date_series(db.get_bind().dialect.name, start_date, end_date)
     
+    if settings.ANALYTICS_USE_DAILY_STATS:
+        # Night and arrival columns of the rollup
+        nightly = (
+            select(
+                DailyStats.date.label('night'),
+                func.sum(DailyStats.stays).label('bookings'),
+                func.sum(DailyStats.cancelled_stays).label('cancellations'),
+                func.sum(DailyStats.bookings).label('arrivals'),
+                func.sum(DailyStats.cancellations).label('cancelled_arrivals')
+            ).where(_in_range(start_date, end_date))
+            .group_by(DailyStats.date)
+            .subquery()
+        )
+        stmt = (
+            select(
+                series.c.night,
+                nightly.c.bookings,
+                nightly.c.cancellations,
+                nightly.c.arrivals,
+                nightly.c.cancelled_arrivals
+            ).select_from(series)
+            .outerjoin(nightly, nightly.c.night == series.c.night)
+        )
+    else:
+        # Bookings in house per night; arrivals are the stays starting that night
+        cancelled = Booking.status == BookingStatus.CANCELLED.value
+        arrival = Booking.check_in == series.c.night
+        stmt = (
+            select(
+                series.c.night,
+                func.count(Booking.id).label('bookings'),
+                func.sum(case((cancelled, 1), else_=0)).label('cancellations'),
+                func.sum(case((arrival, 1), else_=0)).label('arrivals'),
+                func.sum(case((and_(arrival, cancelled), 1), else_=0)).label('cancelled_arrivals')
+            ).select_from(series)
+            .outerjoin(Booking, _in_house(series.c.night))
+            .group_by(series.c.night)
+        )
+    
+    result = await db.execute(stmt.order_by(series.c.night))
+    
+    return _trend_payload(result)
+
+
+def _trend_payload(rows) -> dict:
+    """
+    Build the booking trend response from per-night rows
+    (night, bookings, cancellations, arrivals, cancelled_arrivals).
+    """
     daily_trends = []
     peak_day = None
     peak_count = 0
     total_bookings = 0
     total_cancellations = 0
     
-    for row in result:
-        bookings = row.total_bookings or 0
+    for row in rows:
+        bookings = row.bookings or 0
         cancellations = row.cancellations or 0
         
-        total_bookings += bookings
-        total_cancellations += cancellations
+        total_bookings += row.arrivals or 0
+        total_cancellations += row.cancelled_arrivals or 0
         
         if bookings > peak_count:
             peak_count = bookings
-            peak_day = row.check_in
+            peak_day = row.night
         
         daily_trends.append({
-            "date": row.check_in,
+            "date": row.night,
             "bookings": bookings,
             "cancellations": cancellations
         })
@@ -277,3 +497,217 @@ async def get_booking_trend_analytics(
         "total_bookings": total_bookings,
         "total_cancellations": total_cancellations
     }
+
+
+# =============================================================================
+# DASHBOARD
+# =============================================================================
+
+# Per (night, room type) cell columns of the dashboard scan
+DASHBOARD_CAPACITY_COLUMNS = ("capacity", "available_rooms")
+DASHBOARD_COLUMNS = BOOKING_STAT_COLUMNS + DASHBOARD_CAPACITY_COLUMNS
+
+
+class _NightRevenue(NamedTuple):
+    night: date
+    revenue: object
+    booking_count: int
+    rooms_sold: int
+    capacity: int
+
+
+class _NightTrend(NamedTuple):
+    night: date
+    bookings: int
+    cancellations: int
+    arrivals: int
+    cancelled_arrivals: int
+
+
+class _RoomTypeTotals(NamedTuple):
+    id: int
+    name: str
+    rooms_booked: int
+    revenue: object
+
+
+@cached_analytics
+async def get_dashboard_analytics(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date
+) -> dict:
+    """
+    Calculate overview, revenue, room type and trend data in one pass.
+    
+    A single grouped statement returns one cell per (night, room type)
+    with conditional aggregates for arrivals and stays plus capacity, from
+    bookings and inventory or from the daily_stats rollup alone. The four
+    payloads are rolled up from those cells and match the individual
+    endpoints.
+    
+    Args:
+        db: Database session
+        start_date: Start of date range
+        end_date: End of date range
+    
+    Returns:
+        Dictionary with overview, revenue, room_types and bookings payloads
+    """
+    dialect_name = db.get_bind().dialect.name
+    
+    if settings.ANALYTICS_USE_DAILY_STATS:
+        # Rollup rows already are (night, room type) cells, capacity included
+        cells = select(
+            DailyStats.date,
+            DailyStats.room_type_id,
+            *(getattr(DailyStats, column) for column in BOOKING_STAT_COLUMNS),
+            DailyStats.capacity,
+            _rollup_available_rooms().label('available_rooms')
+        ).where(_in_range(start_date, end_date)).subquery()
+    else:
+        cells = union_all(
+            _dashboard_booking_cells(dialect_name, start_date, end_date),
+            _dashboard_capacity_cells(start_date, end_date)
+        ).subquery()
+    
+    result = await db.execute(
+        select(
+            cells.c.date,
+            cells.c.room_type_id,
+            RoomType.name,
+            *(func.sum(cells.c[column]).label(column) for column in DASHBOARD_COLUMNS)
+        ).outerjoin(RoomType, RoomType.id == cells.c.room_type_id)
+        .group_by(cells.c.date, cells.c.room_type_id, RoomType.name)
+    )
+    
+    by_night: Dict[date, Dict[str, object]] = {
+        night: dict.fromkeys(DASHBOARD_COLUMNS, 0)
+        for night in get_date_range(start_date, end_date + timedelta(days=1))
+    }
+    by_room_type: Dict[int, Dict[str, object]] = {}
+    
+    for row in result:
+        night_totals = by_night[row.date]
+        for column in DASHBOARD_COLUMNS:
+            night_totals[column] += getattr(row, column) or 0
+        
+        if row.name is not None:
+            room_type_totals = by_room_type.setdefault(
+                row.room_type_id, {"name": row.name, **dict.fromkeys(DASHBOARD_COLUMNS, 0)}
+            )
+            for column in DASHBOARD_COLUMNS:
+                room_type_totals[column] += getattr(row, column) or 0
+    
+    totals = dict.fromkeys(DASHBOARD_COLUMNS, 0)
+    for night_totals in by_night.values():
+        for column in DASHBOARD_COLUMNS:
+            totals[column] += night_totals[column]
+    
+    overview = _overview_metrics(
+        totals["bookings"],
+        totals["confirmed_bookings"],
+        totals["cancellations"],
+        Decimal(totals["revenue"]),
+        totals["room_nights_sold"],
+        totals["available_rooms"]
+    )
+    revenue = _revenue_payload(
+        _NightRevenue(
+            night,
+            values["night_revenue"],
+            values["confirmed_stays"],
+            values["rooms_occupied"],
+            values["capacity"]
+        )
+        for night, values in by_night.items()
+    )
+    room_types = _room_type_payload(
+        _RoomTypeTotals(room_type_id, values["name"], values["rooms_sold"], values["revenue"])
+        for room_type_id, values in sorted(by_room_type.items())
+        if values["confirmed_bookings"] > 0
+    )
+    trends = _trend_payload(
+        _NightTrend(
+            night,
+            values["stays"],
+            values["cancelled_stays"],
+            values["bookings"],
+            values["cancellations"]
+        )
+        for night, values in by_night.items()
+    )
+    
+    return {
+        "overview": overview,
+        "revenue": revenue,
+        "room_types": room_types,
+        "bookings": trends
+    }
+
+
+def _dashboard_capacity_cells(start_date: date, end_date: date):
+    """
+    Live and archived inventory per (night, room type) with the capacity
+    columns set and the booking columns zeroed. Archived nights have
+    nothing left to sell.
+    """
+    zeros = (literal(0) for _ in BOOKING_STAT_COLUMNS)
+    inventory_cells = union_all(
+        select(Inventory.date, Inventory.room_type_id, Inventory.available_rooms)
+        .where(and_(Inventory.date >= start_date, Inventory.date <= end_date)),
+        select(InventoryArchive.date, InventoryArchive.room_type_id, literal(0))
+        .where(and_(InventoryArchive.date >= start_date, InventoryArchive.date <= end_date))
+    ).subquery()
+    
+    return select(
+        inventory_cells.c.date,
+        inventory_cells.c.room_type_id,
+        *zeros,
+        func.coalesce(RoomType.total_rooms, 0),
+        inventory_cells.c.available_rooms
+    ).outerjoin(RoomType, RoomType.id == inventory_cells.c.room_type_id)
+
+
+def _dashboard_booking_cells(dialect_name: str, start_date: date, end_date: date):
+    """
+    Bookings in house during the range expanded to nights and grouped by
+    (night, room type), with the daily_stats column names. A booking's
+    arrival figures land on its check-in night.
+    """
+    series = sql_date_series(dialect_name, start_date, end_date)
+    nights = sql_days_between(dialect_name, Booking.check_in, Booking.check_out)
+    confirmed = Booking.status == BookingStatus.CONFIRMED.value
+    cancelled = Booking.status == BookingStatus.CANCELLED.value
+    arrival = Booking.check_in == series.c.night
+    confirmed_arrival = and_(arrival, confirmed)
+    
+    return (
+        select(
+            series.c.night.label('date'),
+            Booking.room_type_id,
+            func.sum(case((arrival, 1), else_=0)).label('bookings'),
+            func.sum(case((confirmed_arrival, 1), else_=0)).label('confirmed_bookings'),
+            func.sum(case((and_(arrival, cancelled), 1), else_=0)).label('cancellations'),
+            func.sum(case((confirmed_arrival, Booking.num_rooms), else_=0)).label('rooms_sold'),
+            func.sum(case((confirmed_arrival, Booking.num_rooms * nights), else_=0)).label('room_nights_sold'),
+            func.sum(case((confirmed_arrival, Booking.total_amount), else_=0)).label('revenue'),
+            func.sum(case((and_(arrival, ~cancelled), Booking.num_rooms), else_=0)).label('rooms_reserved'),
+            func.count(Booking.id).label('stays'),
+            func.sum(case((confirmed, 1), else_=0)).label('confirmed_stays'),
+            func.sum(case((cancelled, 1), else_=0)).label('cancelled_stays'),
+            func.sum(case((confirmed, Booking.num_rooms), else_=0)).label('rooms_occupied'),
+            func.sum(
+                case((confirmed, sql_night_revenue(dialect_name, nights)), else_=0)
+            ).label('night_revenue'),
+            func.sum(case((cancelled, 0), else_=Booking.num_rooms)).label('rooms_in_house'),
+            *(literal(0).label(column) for column in DASHBOARD_CAPACITY_COLUMNS)
+        ).select_from(series)
+        .join(Booking, _in_house(series.c.night))
+        .where(
+            and_(
+                Booking.check_in <= end_date,
+                Booking.check_out > start_date
+            )
+        ).group_by(series.c.night, Booking.room_type_id)
+    )
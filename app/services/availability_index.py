@@ -0,0 +1,357 @@
+"""
+In-process availability index for fast read-only availability queries.
+
+Holds, per room type, compact arrays of available rooms and nightly prices
+keyed by day offset from the index start date (today at load time), with
+segment trees for O(log n) range min/sum queries.
+
+WRITE-THROUGH:
+- Inventory mutations record their changes on the session (db.info)
+- After COMMIT the recorded changes are applied to the index
+- After any ROLLBACK (including savepoints) the recorded changes are dropped
+  and the index is fully reloaded after the next commit
+- A load that overlaps such a commit (from before_commit to after_commit)
+  is discarded: its snapshot may already contain changes that are applied
+  again after the commit
+
+The index only serves read paths. Reservations always validate against the
+database under row locks, so a stale index can never cause an overbooking.
+Entries expire after AVAILABILITY_INDEX_TTL_SECONDS to bound staleness when
+several worker processes write to the same database.
+"""
+
+import asyncio
+import time
+from array import array
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.database import async_session_maker
+from app.models.inventory import Inventory
+from app.models.room_type import RoomType
+from app.utils.segment_tree import SegmentTree, INF, min_tree, sum_tree
+
+settings = get_settings()
+
+# Sentinel for days without an inventory record
+MISSING = -1
+
+_PENDING_KEY = "availability_index_pending"
+_COMMITTING_KEY = "availability_index_committing"
+
+
+def _to_cents(price: Decimal) -> int:
+    return int((Decimal(price) * 100).to_integral_value())
+
+
+def _from_cents(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+
+class RoomTypeAvailability:
+    """
+    Availability arrays for a single room type.
+    Index i holds the values for start_date + i days.
+    
+    Segment trees over the arrays answer range min (available rooms),
+    range sum (price) in O(log n) and are kept in sync by point updates.
+    """
+    
+    __slots__ = (
+        "room_type_id", "name", "total_rooms", "start_date", "available", "prices",
+        "_min_available", "_price_sum"
+    )
+    
+    def __init__(
+        self,
+        room_type_id: int,
+        name: str,
+        total_rooms: int,
+        start_date: date,
+        num_days: int
+    ):
+        self.room_type_id = room_type_id
+        self.name = name
+        self.total_rooms = total_rooms
+        self.start_date = start_date
+        self.available = array("i", [MISSING]) * num_days
+        self.prices = array("q", [0]) * num_days
+        self._min_available: Optional[SegmentTree] = None
+        self._price_sum: Optional[SegmentTree] = None
+    
+    def build(self) -> None:
+        """Build the segment trees once the arrays are filled."""
+        self._min_available = min_tree(
+            INF if v == MISSING else v for v in self.available
+        )
+        self._price_sum = sum_tree(self.prices)
+    
+    def _update_trees(self, i: int) -> None:
+        if self._min_available is None:
+            return
+        
+        value = self.available[i]
+        self._min_available.update(i, INF if value == MISSING else value)
+        self._price_sum.update(i, self.prices[i])
+    
+    def offsets(self, start_date: date, end_date: date) -> Tuple[int, int]:
+        """Convert a date range to array offsets (clamped to the array)."""
+        start = max((start_date - self.start_date).days, 0)
+        end = min((end_date - self.start_date).days, len(self.available))
+        return start, max(start, end)
+    
+    def min_available(self, start_date: date, end_date: date) -> Optional[int]:
+        """Minimum available rooms over days that have inventory (O(log n))."""
+        start, end = self.offsets(start_date, end_date)
+        value = self._min_available.query(start, end)
+        return None if value == INF else value
+    
+    def total_price(self, start_date: date, end_date: date) -> Decimal:
+        """Sum of nightly prices over days that have inventory (O(log n))."""
+        start, end = self.offsets(start_date, end_date)
+        return _from_cents(self._price_sum.query(start, end))
+    
+    def daily(self, start_date: date, end_date: date) -> Iterator[Tuple[date, int, Decimal]]:
+        """Yield (date, available_rooms, price) for days that have inventory."""
+        start, end = self.offsets(start_date, end_date)
+        for i in range(start, end):
+            if self.available[i] != MISSING:
+                yield self.start_date + timedelta(days=i), self.available[i], _from_cents(self.prices[i])
+    
+    def apply_delta(self, dates: Iterable[date], delta: int) -> None:
+        """Add delta rooms to each date (restores are capped at total_rooms)."""
+        for day in dates:
+            i = (day - self.start_date).days
+            if 0 <= i < len(self.available) and self.available[i] != MISSING:
+                self.available[i] = max(0, min(self.available[i] + delta, self.total_rooms))
+                self._update_trees(i)
+    
+    def set_day(self, day: date, available_rooms: int, price: Decimal) -> None:
+        """Overwrite the values for a single date."""
+        i = (day - self.start_date).days
+        if 0 <= i < len(self.available):
+            self.available[i] = available_rooms
+            self.prices[i] = _to_cents(price)
+            self._update_trees(i)
+
+
+class AvailabilityIndex:
+    """Process-wide availability index for all room types."""
+    
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self.start_date: Optional[date] = None
+        self._room_types: Dict[int, RoomTypeAvailability] = {}
+        self._loaded_at: Optional[float] = None
+        self._version = 0
+        self._commits_in_flight = 0
+        self._lock = asyncio.Lock()
+    
+    # -------------------------------------------------------------------------
+    # Loading
+    # -------------------------------------------------------------------------
+    
+    def is_fresh(self) -> bool:
+        """Whether the index is loaded and within its TTL."""
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl_seconds
+        )
+    
+    async def ensure_loaded(self) -> bool:
+        """
+        Load the index if it is empty, stale or invalidated.
+        
+        Loads always read the primary database in their own session, never
+        the caller's (possibly read replica) session: the index is kept in
+        sync with commits on the primary, and a lagging replica snapshot
+        would miss changes that are never applied again.
+        
+        Returns:
+            True if the index can serve reads, False if disabled or the
+            load was discarded (callers then query the database)
+        """
+        if not settings.AVAILABILITY_INDEX_ENABLED:
+            return False
+        
+        if self.is_fresh():
+            return True
+        
+        async with self._lock:
+            if not self.is_fresh():
+                async with async_session_maker() as db:
+                    await self._load(db)
+        
+        return self.is_fresh()
+    
+    async def _load(self, db: AsyncSession) -> None:
+        """Rebuild the index from the database (2 queries)."""
+        version = self._version
+        # A commit already past the database may or may not be in the snapshot
+        overlaps_commit = self._commits_in_flight > 0
+        start_date = date.today()
+        
+        result = await db.execute(
+            select(RoomType.id, RoomType.name, RoomType.total_rooms)
+        )
+        room_type_rows = result.all()
+        
+        result = await db.execute(
+            select(
+                Inventory.room_type_id,
+                Inventory.date,
+                Inventory.available_rooms,
+                Inventory.price
+            )
+            .where(Inventory.date >= start_date)
+        )
+        inventory_rows = result.all()
+        
+        last_date = max((row.date for row in inventory_rows), default=start_date)
+        num_days = (last_date - start_date).days + 1
+        
+        room_types = {
+            row.id: RoomTypeAvailability(row.id, row.name, row.total_rooms, start_date, num_days)
+            for row in room_type_rows
+        }
+        for row in inventory_rows:
+            room_type = room_types.get(row.room_type_id)
+            if room_type is not None:
+                room_type.set_day(row.date, row.available_rooms, row.price)
+        for room_type in room_types.values():
+            room_type.build()
+        
+        # A commit started while loading (before_commit bumps the version)
+        # may be in the snapshot and would be applied to it a second time;
+        # discard the snapshot and leave the index stale
+        if overlaps_commit or version != self._version:
+            self._loaded_at = None
+            return
+        
+        self.start_date = start_date
+        self._room_types = room_types
+        self._loaded_at = time.monotonic()
+    
+    def invalidate(self) -> None:
+        """Force a full reload on the next read."""
+        self._version += 1
+        self._loaded_at = None
+    
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+    
+    def covers(self, start_date: date) -> bool:
+        """Whether ranges starting at start_date can be answered from memory."""
+        return self.start_date is not None and start_date >= self.start_date
+    
+    def get(self, room_type_id: int) -> Optional[RoomTypeAvailability]:
+        """Get availability arrays for a room type."""
+        return self._room_types.get(room_type_id)
+    
+    def room_types(self) -> List[RoomTypeAvailability]:
+        """Get availability arrays for all room types, ordered by ID."""
+        return [self._room_types[key] for key in sorted(self._room_types)]
+    
+    # -------------------------------------------------------------------------
+    # Write-through (recorded on the session, applied after commit)
+    # -------------------------------------------------------------------------
+    
+    def record_delta(
+        self,
+        db: AsyncSession,
+        room_type_id: int,
+        dates: Iterable[date],
+        delta: int
+    ) -> None:
+        """Record a change of `delta` rooms on each date."""
+        db.info.setdefault(_PENDING_KEY, []).append(
+            ("delta", room_type_id, list(dates), delta)
+        )
+    
+    def record_set(
+        self,
+        db: AsyncSession,
+        room_type_id: int,
+        day: date,
+        available_rooms: int,
+        price: Decimal
+    ) -> None:
+        """Record an absolute update of one inventory record."""
+        db.info.setdefault(_PENDING_KEY, []).append(
+            ("set", room_type_id, day, available_rooms, price)
+        )
+    
+    def record_invalidate(self, db: AsyncSession) -> None:
+        """Record a change that requires a full reload (e.g. new inventory)."""
+        db.info.setdefault(_PENDING_KEY, []).append(("invalidate",))
+    
+    def _begin_commit(self) -> None:
+        self._version += 1
+        self._commits_in_flight += 1
+    
+    def _end_commit(self) -> None:
+        self._version += 1
+        self._commits_in_flight -= 1
+    
+    def _apply(self, pending: list) -> None:
+        self._version += 1
+        
+        for change in pending:
+            kind = change[0]
+            if kind == "invalidate":
+                self.invalidate()
+                continue
+            
+            room_type = self._room_types.get(change[1])
+            if room_type is None:
+                continue
+            
+            if kind == "delta":
+                room_type.apply_delta(change[2], change[3])
+            elif kind == "set":
+                room_type.set_day(change[2], change[3], change[4])
+
+
+availability_index = AvailabilityIndex(settings.AVAILABILITY_INDEX_TTL_SECONDS)
+
+
+@event.listens_for(Session, "before_commit")
+def _begin_pending_commit(session: Session) -> None:
+    """Invalidate loads running while recorded changes are being committed."""
+    if session.info.get(_PENDING_KEY) and not session.info.get(_COMMITTING_KEY):
+        session.info[_COMMITTING_KEY] = True
+        availability_index._begin_commit()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_changes(session: Session) -> None:
+    """Apply recorded inventory changes once they are durable."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        availability_index._apply(pending)
+    
+    if session.info.pop(_COMMITTING_KEY, False):
+        availability_index._end_commit()
+
+
+@event.listens_for(Session, "after_rollback")
+def _end_failed_commit(session: Session) -> None:
+    """A commit that failed after before_commit is no longer in flight."""
+    if session.info.pop(_COMMITTING_KEY, False):
+        availability_index._end_commit()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_changes(session: Session, previous_transaction) -> None:
+    """
+    Recorded changes can no longer be trusted after a rollback (a savepoint
+    may have undone only part of them) - reload after the next commit instead.
+    """
+    if session.info.get(_PENDING_KEY):
+        session.info[_PENDING_KEY] = [("invalidate",)]
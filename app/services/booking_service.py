@@ -5,40 +5,44 @@ Handles the complete booking flow with ATOMIC TRANSACTIONAL INTEGRITY.
 TRANSACTION FLOW:
 1. Validate dates
 2. Verify room type exists
-3. Check availability (read-only)
-4. BEGIN TRANSACTION
-   4a. Lock inventory rows (SELECT FOR UPDATE)
-   4b. Reserve inventory (deduct rooms)
-   4c. Create/update customer
-   4d. Create booking record
-5. COMMIT (success) or ROLLBACK (any failure)
+3. BEGIN TRANSACTION
+   3a. Lock inventory rows (SELECT FOR UPDATE) and check availability
+   3b. Reserve inventory (deduct rooms)
+   3c. Create/update customer
+   3d. Create booking record and update the daily stats rollup
+4. COMMIT (success) or ROLLBACK (any failure)
 """
 
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import AsyncIterator, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, lazyload
 
+from app.core.database import stream_query
 from app.models.booking import Booking, BookingStatus
 from app.models.customer import Customer
 from app.models.room_type import RoomType
 from app.schemas.booking import BookingCreate, BookingRead
 from app.services.inventory_service import (
-    check_availability,
     reserve_inventory,
-    restore_inventory
+    restore_inventory,
+    diff_stay_inventory,
+    apply_inventory_changes,
+    get_stay_price
 )
 from app.core.exceptions import (
     InvalidDateRangeError,
-    InventoryUnavailableError,
-    InventoryNotFoundError,
     RoomTypeNotFoundError,
     BookingNotFoundError,
-    BookingAlreadyCancelledError
+    BookingAlreadyCancelledError,
+    InventoryRestoreError
 )
+from app.utils.date_utils import get_date_range
 from app.services.audit_service import log_action, AuditAction, EntityType
+from app.services.inventory_maintenance_service import count_archived_nights
+from app.services.daily_stats_service import record_booking_change, snapshot_booking
 
 
 # =============================================================================
@@ -70,9 +74,11 @@ async def get_or_create_customer(
     Returns:
         Customer model instance
     """
-    # Try to find existing customer
+    # Try to find existing customer (booking history is not needed here)
     result = await db.execute(
-        select(Customer).where(Customer.email == email)
+        select(Customer)
+        .options(lazyload(Customer.bookings))
+        .where(Customer.email == email)
     )
     customer = result.scalar_one_or_none()
     
@@ -118,8 +124,7 @@ async def create_booking(
     This is the main booking entry point. It handles:
     - Date validation
     - Room type verification
-    - Availability check
-    - Inventory reservation (with row locking)
+    - Inventory reservation with availability check (with row locking)
     - Customer creation/update
     - Booking record creation
     
@@ -130,7 +135,7 @@ async def create_booking(
         booking_data: Booking creation schema
     
     Returns:
-        Created Booking model instance
+        Created Booking model instance with customer and room_type loaded
     
     Raises:
         InvalidDateRangeError: If dates are invalid
@@ -159,28 +164,14 @@ async def create_booking(
         raise RoomTypeNotFoundError(booking_data.room_type_id)
     
     # ==========================================================================
-    # STEP 3: Pre-check availability (read-only, no locks)
-    # ==========================================================================
-    is_available, min_rooms, estimated_price = await check_availability(
-        db,
-        booking_data.room_type_id,
-        booking_data.check_in,
-        booking_data.check_out,
-        booking_data.num_rooms
-    )
-    
-    if not is_available:
-        raise InventoryUnavailableError(
-            f"Only {min_rooms} room(s) available, requested {booking_data.num_rooms}"
-        )
-    
-    # ==========================================================================
-    # STEP 4: ATOMIC TRANSACTION - Reserve inventory and create booking
+    # STEP 3: ATOMIC TRANSACTION - Reserve inventory and create booking
     # ==========================================================================
     # Use session.begin() for explicit transaction control
     # If ANY operation fails, ALL changes are rolled back automatically
     async with db.begin_nested():  # Savepoint for nested transaction safety
-        # 4a. Reserve inventory (locks rows with SELECT FOR UPDATE)
+        # 3a. Reserve inventory (locks rows with SELECT FOR UPDATE)
+        # Availability is validated here, under the lock - there is no
+        # separate read-only pre-check.
         # This is the CRITICAL section that prevents overbooking
         calculated_amount = await reserve_inventory(
             db,
@@ -193,7 +184,7 @@ async def create_booking(
         # Use manual total_amount if provided, otherwise use calculated
         total_amount = booking_data.total_amount if booking_data.total_amount is not None else calculated_amount
         
-        # 4b. Get or create customer
+        # 3b. Get or create customer
         customer = await get_or_create_customer(
             db,
             name=booking_data.customer.name,
@@ -204,10 +195,12 @@ async def create_booking(
             id_proof_number=booking_data.customer.id_proof_number
         )
         
-        # 4c. Create booking record
+        # 3c. Create booking record
+        # Relationships are attached up front so the caller can build the
+        # response without reloading the booking
         booking = Booking(
-            customer_id=customer.id,
-            room_type_id=booking_data.room_type_id,
+            customer=customer,
+            room_type=room_type,
             check_in=booking_data.check_in,
             check_out=booking_data.check_out,
             num_rooms=booking_data.num_rooms,
@@ -219,7 +212,10 @@ async def create_booking(
         db.add(booking)
         await db.flush()
         
-        # 4d. Log audit trail (same transaction)
+        # 3d. Update the daily stats rollup (same transaction)
+        await record_booking_change(db, None, snapshot_booking(booking))
+        
+        # 3e. Log audit trail (same transaction)
         await log_action(
             db,
             user_id=None,  # Will be updated when we pass user context
@@ -238,10 +234,11 @@ async def create_booking(
         )
     
     # ==========================================================================
-    # STEP 5: Commit transaction
+    # STEP 4: Commit transaction
     # ==========================================================================
+    # No refresh needed: created_at comes back via INSERT ... RETURNING
+    # and expire_on_commit=False keeps customer and room_type loaded
     await db.commit()
-    await db.refresh(booking)
     
     return booking
 
@@ -250,6 +247,24 @@ async def create_booking(
 # BOOKING CANCELLATION (ATOMIC TRANSACTION)
 # =============================================================================
 
+async def _expected_restores(db: AsyncSession, nights: List[Tuple[int, date]]) -> int:
+    """
+    Count the released nights that should still live in the inventory table.
+    
+    Nights already moved to inventory_archive are never restored. The
+    archive is read in the same transaction rather than inferred from the
+    archive cutoff, which runs ahead of the maintenance job.
+    
+    Args:
+        db: Database session
+        nights: (room_type_id, date) pairs being released
+    
+    Returns:
+        Number of inventory rows expected to be restored
+    """
+    return len(nights) - await count_archived_nights(db, nights)
+
+
 async def cancel_booking(
     db: AsyncSession,
     booking_id: int,
@@ -269,6 +284,7 @@ async def cancel_booking(
     Raises:
         BookingNotFoundError: If booking doesn't exist
         BookingAlreadyCancelledError: If already cancelled
+        InventoryRestoreError: If inventory is missing for any night
     """
     # Find booking
     result = await db.execute(
@@ -285,7 +301,7 @@ async def cancel_booking(
     # Atomic cancellation with inventory restoration
     async with db.begin_nested():
         # Restore inventory (releases the reserved rooms)
-        await restore_inventory(
+        restored = await restore_inventory(
             db,
             booking.room_type_id,
             booking.check_in,
@@ -293,12 +309,24 @@ async def cancel_booking(
             booking.num_rooms
         )
         
+        nights = await _expected_restores(db, [
+            (booking.room_type_id, night)
+            for night in get_date_range(booking.check_in, booking.check_out)
+        ])
+        if restored != nights:
+            raise InventoryRestoreError(
+                f"Inventory missing for {nights - restored} of {nights} night(s) "
+                f"of booking {booking.id}"
+            )
+        
         # Update booking status
+        before = snapshot_booking(booking)
         booking.status = BookingStatus.CANCELLED.value
         if reason:
             existing_notes = booking.notes or ""
             booking.notes = f"{existing_notes}\nCancellation reason: {reason}".strip()
         
+        await record_booking_change(db, before, snapshot_booking(booking))
         await db.flush()
     
     await db.commit()
@@ -326,12 +354,14 @@ async def modify_booking(
     1. Fetch existing booking
     2. Validate modification is allowed (only confirmed bookings)
     3. BEGIN TRANSACTION
-       3a. Restore old inventory (rollback the original reservation)
-       3b. Check availability for new dates/room type
-       3c. Reserve new inventory (make new reservation)
+       3a. Diff old and new (room_type, date, rooms) per night
+       3b. Reserve added nights (locked, checked) and restore released nights
+       3c. Recalculate price for the new stay
        3d. Update booking record
     4. COMMIT or ROLLBACK (if any step fails)
     
+    Nights present in both the old and new reservation are not touched.
+    
     Args:
         db: Database session
         booking_id: ID of the booking to modify
@@ -349,6 +379,7 @@ async def modify_booking(
         InvalidDateRangeError: If new dates are invalid
         RoomTypeNotFoundError: If new room type doesn't exist
         InventoryUnavailableError: If new inventory is not available
+        InventoryRestoreError: If old inventory is missing for any night
     """
     from app.core.exceptions import BookingNotModifiableError
     
@@ -418,38 +449,32 @@ async def modify_booking(
             raise RoomTypeNotFoundError(final_room_type_id)
     
     # ==========================================================================
-    # STEP 6: ATOMIC TRANSACTION - Rollback old, reserve new
+    # STEP 6: ATOMIC TRANSACTION - Apply only the changed nights
     # ==========================================================================
     async with db.begin_nested():
-        # 6a. ROLLBACK: Restore old inventory
-        # This releases the rooms that were originally reserved
-        await restore_inventory(
-            db,
-            old_room_type_id,
-            old_check_in,
-            old_check_out,
-            old_num_rooms
+        # 6a. DIFF: Per-night difference between old and new reservation
+        # e.g. extending checkout by one night touches exactly one row
+        changes = diff_stay_inventory(
+            old_room_type_id, old_check_in, old_check_out, old_num_rooms,
+            final_room_type_id, final_check_in, final_check_out, final_num_rooms
         )
         
-        # 6b. CHECK: Verify new inventory is available
-        is_available, min_rooms, _ = await check_availability(
-            db,
-            final_room_type_id,
-            final_check_in,
-            final_check_out,
-            final_num_rooms
-        )
+        # 6b. APPLY: Reserve added nights (locked + checked) and restore
+        # released nights. If the new nights are unavailable the savepoint
+        # rolls back and the original reservation is untouched
+        restored = await apply_inventory_changes(db, changes)
         
-        if not is_available:
-            # Inventory not available - transaction will rollback
-            # This means the original reservation will be restored
-            raise InventoryUnavailableError(
-                f"Only {min_rooms} room(s) available for new dates/room type, "
-                f"requested {final_num_rooms}"
+        expected_restores = await _expected_restores(db, [
+            key for key, delta in changes.items() if delta < 0
+        ])
+        if restored != expected_restores:
+            raise InventoryRestoreError(
+                f"Inventory missing for {expected_restores - restored} of "
+                f"{expected_restores} released night(s) of booking {booking.id}"
             )
         
-        # 6c. RESERVE: Reserve new inventory
-        new_total_amount = await reserve_inventory(
+        # 6c. PRICE: Recalculate the total for the new stay
+        new_total_amount = await get_stay_price(
             db,
             final_room_type_id,
             final_check_in,
@@ -458,6 +483,7 @@ async def modify_booking(
         )
         
         # 6d. UPDATE: Update booking record
+        before = snapshot_booking(booking)
         booking.check_in = final_check_in
         booking.check_out = final_check_out
         booking.room_type_id = final_room_type_id
@@ -476,6 +502,8 @@ async def modify_booking(
         existing_notes = booking.notes or ""
         booking.notes = f"{existing_notes}{mod_note}".strip()
         
+        # 6e. STATS: Move the booking's figures in the daily stats rollup
+        await record_booking_change(db, before, snapshot_booking(booking))
         await db.flush()
     
     # ==========================================================================
@@ -548,3 +576,80 @@ def booking_to_read_schema(booking: Booking) -> BookingRead:
         notes=booking.notes,
         created_at=booking.created_at
     )
+
+
+async def stream_bookings(
+    status_filter: Optional[str] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> AsyncIterator[BookingRead]:
+    """
+    Stream bookings from a server-side cursor in its own session.
+    
+    Uses a column projection joined with customers and room types, so no
+    ORM entities (or their eagerly loaded relationships) are materialized.
+    Same filters and ordering as the bookings list endpoint.
+    
+    Args:
+        status_filter: Optional booking status
+        from_date: Optional minimum check-in date
+        to_date: Optional maximum check-in date
+        limit: Optional maximum number of bookings (None = all)
+        offset: Number of bookings to skip
+    
+    Yields:
+        BookingRead schemas
+    """
+    query = (
+        select(
+            Booking.id,
+            Booking.customer_id,
+            Customer.name.label("customer_name"),
+            Customer.email.label("customer_email"),
+            Booking.room_type_id,
+            RoomType.name.label("room_type_name"),
+            Booking.check_in,
+            Booking.check_out,
+            Booking.num_rooms,
+            Booking.total_amount,
+            Booking.amount_paid,
+            Booking.status,
+            Booking.notes,
+            Booking.created_at
+        )
+        .join(Customer, Booking.customer_id == Customer.id)
+        .join(RoomType, Booking.room_type_id == RoomType.id)
+    )
+    
+    if status_filter:
+        query = query.where(Booking.status == status_filter)
+    
+    if from_date:
+        query = query.where(Booking.check_in >= from_date)
+    
+    if to_date:
+        query = query.where(Booking.check_in <= to_date)
+    
+    query = query.order_by(Booking.created_at.desc()).offset(offset).limit(limit)
+    
+    async for row in stream_query(query):
+        yield BookingRead(
+            id=row.id,
+            customer_id=row.customer_id,
+            customer_name=row.customer_name,
+            customer_email=row.customer_email,
+            room_type_id=row.room_type_id,
+            room_type_name=row.room_type_name,
+            check_in=row.check_in,
+            check_out=row.check_out,
+            num_rooms=row.num_rooms,
+            total_amount=row.total_amount,
+            amount_paid=row.amount_paid,
+            # Same computation as Booking.balance_due
+            balance_due=float(row.total_amount) - float(row.amount_paid or 0),
+            status=row.status,
+            notes=row.notes,
+            created_at=row.created_at
+        )
@@ -4,22 +4,53 @@ Calendar service for generating frontend-ready calendar data.
 Responsibilities:
 - Fetch inventory data by date range (efficient single query)
 - Join with room types for display names
-- Calculate availability status
+- Calculate availability status (in SQL for database reads)
+- Build compact room type x date matrices for large grids
 - Transform bookings into calendar event blocks
+- Stream grid cells and events for large exports
 """
 
-from datetime import date
-from typing import List, Tuple
+from datetime import date, timedelta
+from itertools import groupby
+from typing import AsyncIterator, List, Tuple
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, and_, case, func, true
 
+from app.core.config import get_settings
+from app.models.daily_stats import DailyStats
 from app.models.inventory import Inventory
 from app.models.room_type import RoomType
 from app.models.booking import Booking, BookingStatus
-from app.schemas.calendar import CalendarAvailability, BookingEvent, CalendarSummary
+from app.models.customer import Customer
+from app.core.database import stream_query
+from app.schemas.calendar import (
+    CalendarAvailability,
+    CalendarAvailabilityMatrix,
+    MatrixRoomType,
+    BookingEvent,
+    CalendarSummary
+)
 from app.core.exceptions import InvalidDateRangeError
+from app.services.availability_index import availability_index
+
+settings = get_settings()
+
+
+def _validate_grid_range(start_date: date, end_date: date) -> None:
+    """
+    Validate an availability grid range (at most CALENDAR_MAX_RANGE_DAYS).
+    
+    Raises:
+        InvalidDateRangeError: If the range is empty or too long
+    """
+    if end_date <= start_date:
+        raise InvalidDateRangeError("End date must be after start date")
+    
+    if (end_date - start_date).days > settings.CALENDAR_MAX_RANGE_DAYS:
+        raise InvalidDateRangeError(
+            f"Date range cannot exceed {settings.CALENDAR_MAX_RANGE_DAYS} days"
+        )
 
 
 def calculate_status(available_rooms: int, total_rooms: int) -> str:
@@ -41,6 +72,15 @@ def calculate_status(available_rooms: int, total_rooms: int) -> str:
         return "full"
 
 
+def availability_status_expression():
+    """SQL expression equivalent to calculate_status for Inventory/RoomType rows."""
+    return case(
+        (Inventory.available_rooms == RoomType.total_rooms, "available"),
+        (Inventory.available_rooms > 0, "partial"),
+        else_="full"
+    )
+
+
 async def get_availability_grid(
     db: AsyncSession,
     start_date: date,
@@ -62,12 +102,52 @@ async def get_availability_grid(
     Returns:
         List of CalendarAvailability objects
     """
-    if end_date <= start_date:
-        raise InvalidDateRangeError("End date must be after start date")
+    _validate_grid_range(start_date, end_date)
+    
+    # Serve from the in-memory availability index when possible
+    if await availability_index.ensure_loaded() and availability_index.covers(start_date):
+        return _availability_grid_from_index(start_date, end_date, room_type_id)
+    
+    result = await db.execute(_availability_grid_query(start_date, end_date, room_type_id))
     
-    # Build query with JOIN to room_types
+    # Transform to response schema
+    return [_grid_cell(row) for row in result]
+
+
+def stream_availability_grid(
+    start_date: date,
+    end_date: date,
+    room_type_id: int = None
+) -> AsyncIterator[CalendarAvailability]:
+    """
+    Stream the availability grid from a server-side cursor in its own session.
+    Same cells and ordering as get_availability_grid.
+    
+    Raises:
+        InvalidDateRangeError: If the date range is invalid (before streaming)
+    """
+    _validate_grid_range(start_date, end_date)
+    
+    return _stream_grid_cells(_availability_grid_query(start_date, end_date, room_type_id))
+
+
+async def _stream_grid_cells(query) -> AsyncIterator[CalendarAvailability]:
+    async for row in stream_query(query):
+        yield _grid_cell(row)
+
+
+def _availability_grid_query(start_date: date, end_date: date, room_type_id: int = None):
+    """Column projection with JOIN to room_types; status is computed in SQL."""
     query = (
-        select(Inventory, RoomType)
+        select(
+            Inventory.date,
+            RoomType.id,
+            RoomType.name,
+            Inventory.available_rooms,
+            RoomType.total_rooms,
+            Inventory.price,
+            availability_status_expression().label("status")
+        )
         .join(RoomType, Inventory.room_type_id == RoomType.id)
         .where(
             and_(
@@ -81,25 +161,148 @@ async def get_availability_grid(
     if room_type_id:
         query = query.where(Inventory.room_type_id == room_type_id)
     
-    result = await db.execute(query)
-    rows = result.all()
+    return query
+
+
+def _grid_cell(row) -> CalendarAvailability:
+    return CalendarAvailability(
+        date=row.date,
+        room_type_id=row.id,
+        room_type_name=row.name,
+        available_rooms=row.available_rooms,
+        total_rooms=row.total_rooms,
+        price=row.price,
+        status=row.status
+    )
+
+
+def _availability_grid_from_index(
+    start_date: date,
+    end_date: date,
+    room_type_id: int = None
+) -> List[CalendarAvailability]:
+    """
+    Build the availability grid from the in-memory availability index.
+    Same ordering as the database path: by date, then room type name.
+    """
+    room_types = sorted(availability_index.room_types(), key=lambda rt: rt.name)
+    
+    if room_type_id:
+        room_types = [rt for rt in room_types if rt.room_type_id == room_type_id]
     
-    # Transform to response schema
-    availability_grid = []
-    for inventory, room_type in rows:
-        status = calculate_status(inventory.available_rooms, room_type.total_rooms)
+    cells = []
+    for rt in room_types:
+        for day, available_rooms, price in rt.daily(start_date, end_date):
+            cells.append(CalendarAvailability(
+                date=day,
+                room_type_id=rt.room_type_id,
+                room_type_name=rt.name,
+                available_rooms=available_rooms,
+                total_rooms=rt.total_rooms,
+                price=price,
+                status=calculate_status(available_rooms, rt.total_rooms)
+            ))
+    
+    # Stable sort keeps room type name order within each date
+    cells.sort(key=lambda cell: cell.date)
+    return cells
+
+
+async def get_availability_matrix(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date,
+    room_type_id: int = None
+) -> CalendarAvailabilityMatrix:
+    """
+    Get the availability grid as compact room type x date matrices.
+    
+    Row i of `available` and `prices` belongs to room_types[i], column j to
+    dates[j]; days without inventory are null. Status is left to the client
+    (compare available with total_rooms), which keeps a year-long grid to a
+    few arrays instead of one object per cell.
+    
+    Args:
+        db: Database session
+        start_date: Start date (inclusive)
+        end_date: End date (exclusive)
+        room_type_id: Optional filter for specific room type
+    
+    Returns:
+        CalendarAvailabilityMatrix
+    
+    Raises:
+        InvalidDateRangeError: If the range is empty or too long
+    """
+    _validate_grid_range(start_date, end_date)
+    
+    num_days = (end_date - start_date).days
+    room_types = []
+    available = []
+    prices = []
+    
+    def add_row(rt_id: int, name: str, total_rooms: int, days) -> None:
+        row_available = [None] * num_days
+        row_prices = [None] * num_days
+        for day, available_rooms, price in days:
+            offset = (day - start_date).days
+            row_available[offset] = available_rooms
+            row_prices[offset] = price
         
-        availability_grid.append(CalendarAvailability(
-            date=inventory.date,
-            room_type_id=room_type.id,
-            room_type_name=room_type.name,
-            available_rooms=inventory.available_rooms,
-            total_rooms=room_type.total_rooms,
-            price=inventory.price,
-            status=status
-        ))
+        room_types.append(MatrixRoomType(id=rt_id, name=name, total_rooms=total_rooms))
+        available.append(row_available)
+        prices.append(row_prices)
     
-    return availability_grid
+    if await availability_index.ensure_loaded() and availability_index.covers(start_date):
+        # Serve from the in-memory availability index
+        for rt in sorted(availability_index.room_types(), key=lambda rt: rt.name):
+            if room_type_id and rt.room_type_id != room_type_id:
+                continue
+            add_row(rt.room_type_id, rt.name, rt.total_rooms, rt.daily(start_date, end_date))
+    else:
+        # One outer-joined scan of scalar columns, grouped by room type
+        query = (
+            select(
+                RoomType.id,
+                RoomType.name,
+                RoomType.total_rooms,
+                Inventory.date,
+                Inventory.available_rooms,
+                Inventory.price
+            )
+            .outerjoin(
+                Inventory,
+                and_(
+                    Inventory.room_type_id == RoomType.id,
+                    Inventory.date >= start_date,
+                    Inventory.date < end_date
+                )
+            )
+            .order_by(RoomType.name, RoomType.id, Inventory.date)
+        )
+        
+        if room_type_id:
+            query = query.where(RoomType.id == room_type_id)
+        
+        result = await db.execute(query)
+        
+        for (rt_id, name, total_rooms), rows in groupby(
+            result, key=lambda row: (row.id, row.name, row.total_rooms)
+        ):
+            add_row(rt_id, name, total_rooms, (
+                (row.date, row.available_rooms, row.price)
+                for row in rows
+                if row.date is not None
+            ))
+    
+    return CalendarAvailabilityMatrix(
+        start_date=start_date,
+        end_date=end_date,
+        dates=[start_date + timedelta(days=i) for i in range(num_days)],
+        room_types=room_types,
+        available=available,
+        prices=prices
+    )
 
 
 async def get_booking_events(
@@ -129,13 +332,60 @@ async def get_booking_events(
     if end_date <= start_date:
         raise InvalidDateRangeError("End date must be after start date")
     
-    # Build query with JOINs
+    result = await db.execute(
+        _booking_events_query(start_date, end_date, room_type_id, include_cancelled)
+    )
+    
+    # Transform to calendar events
+    return [_booking_event(row) for row in result]
+
+
+def stream_booking_events(
+    start_date: date,
+    end_date: date,
+    room_type_id: int = None,
+    include_cancelled: bool = False
+) -> AsyncIterator[BookingEvent]:
+    """
+    Stream booking events from a server-side cursor in its own session.
+    Same events and ordering as get_booking_events.
+    
+    Raises:
+        InvalidDateRangeError: If the date range is invalid (before streaming)
+    """
+    if end_date <= start_date:
+        raise InvalidDateRangeError("End date must be after start date")
+    
+    return _stream_booking_events(
+        _booking_events_query(start_date, end_date, room_type_id, include_cancelled)
+    )
+
+
+async def _stream_booking_events(query) -> AsyncIterator[BookingEvent]:
+    async for row in stream_query(query):
+        yield _booking_event(row)
+
+
+def _booking_events_query(
+    start_date: date,
+    end_date: date,
+    room_type_id: int = None,
+    include_cancelled: bool = False
+):
+    """Column projection with JOINs to room_types and customers."""
     query = (
-        select(Booking)
-        .options(
-            selectinload(Booking.room_type),
-            selectinload(Booking.customer)
+        select(
+            Booking.id,
+            Booking.room_type_id,
+            RoomType.name.label("room_type_name"),
+            Customer.name.label("customer_name"),
+            Booking.check_in,
+            Booking.check_out,
+            Booking.num_rooms,
+            Booking.status
         )
+        .join(RoomType, Booking.room_type_id == RoomType.id)
+        .join(Customer, Booking.customer_id == Customer.id)
         .where(
             and_(
                 # Booking overlaps with date range
@@ -152,27 +402,21 @@ async def get_booking_events(
     if not include_cancelled:
         query = query.where(Booking.status != BookingStatus.CANCELLED.value)
     
-    result = await db.execute(query)
-    bookings = result.scalars().all()
-    
-    # Transform to calendar events
-    events = []
-    for booking in bookings:
-        title = f"{booking.room_type.name} - {booking.customer.name}"
-        
-        events.append(BookingEvent(
-            booking_id=booking.id,
-            title=title,
-            room_type_id=booking.room_type_id,
-            room_type_name=booking.room_type.name,
-            customer_name=booking.customer.name,
-            start=booking.check_in,
-            end=booking.check_out,
-            num_rooms=booking.num_rooms,
-            status=booking.status
-        ))
-    
-    return events
+    return query
+
+
+def _booking_event(row) -> BookingEvent:
+    return BookingEvent(
+        booking_id=row.id,
+        title=f"{row.room_type_name} - {row.customer_name}",
+        room_type_id=row.room_type_id,
+        room_type_name=row.room_type_name,
+        customer_name=row.customer_name,
+        start=row.check_in,
+        end=row.check_out,
+        num_rooms=row.num_rooms,
+        status=row.status
+    )
 
 
 async def get_calendar_summary(
@@ -183,6 +427,11 @@ async def get_calendar_summary(
     """
     Get summary statistics for a date range.
     
+    Computed entirely with SQL aggregates in a single round trip, so memory
+    use does not grow with the number of bookings or inventory rows. With
+    ANALYTICS_USE_DAILY_STATS enabled the booking figures come from the
+    daily_stats rollup instead of scanning bookings.
+    
     Args:
         db: Database session
         start_date: Start date
@@ -194,27 +443,31 @@ async def get_calendar_summary(
     if end_date <= start_date:
         raise InvalidDateRangeError("End date must be after start date")
     
-    # Get all bookings in range (excluding cancelled)
-    query = (
-        select(Booking)
-        .where(
-            and_(
-                Booking.check_in < end_date,
-                Booking.check_out > start_date,
-                Booking.status != BookingStatus.CANCELLED.value
+    if settings.ANALYTICS_USE_DAILY_STATS:
+        booking_stats = _booking_stats_from_daily_stats(start_date, end_date)
+    else:
+        # Booking counts (excluding cancelled) aggregated in SQL
+        booking_stats = (
+            select(
+                func.count(Booking.id).label("total_bookings"),
+                func.coalesce(func.sum(Booking.num_rooms), 0).label("total_rooms_booked")
             )
+            .where(
+                and_(
+                    Booking.check_in < end_date,
+                    Booking.check_out > start_date,
+                    Booking.status != BookingStatus.CANCELLED.value
+                )
+            )
+            .subquery()
         )
-    )
-    
-    result = await db.execute(query)
-    bookings = result.scalars().all()
-    
-    total_bookings = len(bookings)
-    total_rooms_booked = sum(b.num_rooms for b in bookings)
     
     # Calculate occupancy (simplified - based on inventory)
-    inventory_query = (
-        select(Inventory, RoomType)
+    inventory_stats = (
+        select(
+            func.coalesce(func.sum(RoomType.total_rooms), 0).label("total_capacity"),
+            func.coalesce(func.sum(Inventory.available_rooms), 0).label("total_available")
+        )
         .join(RoomType, Inventory.room_type_id == RoomType.id)
         .where(
             and_(
@@ -222,13 +475,19 @@ async def get_calendar_summary(
                 Inventory.date < end_date
             )
         )
+        .subquery()
     )
     
-    inv_result = await db.execute(inventory_query)
-    inventory_rows = inv_result.all()
+    # Both single-row aggregates in one round trip
+    result = await db.execute(
+        select(booking_stats, inventory_stats).join(inventory_stats, true())
+    )
+    stats = result.one()
     
-    total_capacity = sum(rt.total_rooms for _, rt in inventory_rows)
-    total_available = sum(inv.available_rooms for inv, _ in inventory_rows)
+    total_bookings = stats.total_bookings
+    total_rooms_booked = stats.total_rooms_booked
+    total_capacity = stats.total_capacity
+    total_available = stats.total_available
     
     if total_capacity > 0:
         occupancy = ((total_capacity - total_available) / total_capacity) * 100
@@ -242,3 +501,44 @@ async def get_calendar_summary(
         total_rooms_booked=total_rooms_booked,
         occupancy_percentage=round(occupancy, 2)
     )
+
+
+def _booking_stats_from_daily_stats(start_date: date, end_date: date):
+    """
+    Booking counts for [start_date, end_date) from the daily_stats rollup.
+    
+    Bookings overlapping the range are those in house on the first night
+    plus those arriving on a later night of the range; cancelled bookings
+    are excluded, like the live query.
+    """
+    first_night = DailyStats.date == start_date
+    
+    return (
+        select(
+            func.coalesce(
+                func.sum(
+                    case(
+                        (first_night, DailyStats.stays - DailyStats.cancelled_stays),
+                        else_=DailyStats.bookings - DailyStats.cancellations
+                    )
+                ),
+                0
+            ).label("total_bookings"),
+            func.coalesce(
+                func.sum(
+                    case(
+                        (first_night, DailyStats.rooms_in_house),
+                        else_=DailyStats.rooms_reserved
+                    )
+                ),
+                0
+            ).label("total_rooms_booked")
+        )
+        .where(
+            and_(
+                DailyStats.date >= start_date,
+                DailyStats.date < end_date
+            )
+        )
+        .subquery()
+    )
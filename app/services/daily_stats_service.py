@@ -0,0 +1,417 @@
+"""
+Daily stats service for maintaining the daily_stats rollup.
+
+Responsibilities:
+- Apply booking changes to the rollup in the caller's transaction
+  (create, cancel, modify, status updates, multi-room bookings)
+- Seed capacity rows when inventory is generated
+- Rebuild the whole rollup from bookings and inventory (backfill)
+
+Arrival columns attribute a booking to (check_in, room_type_id); night
+columns count it on every night in [check_in, check_out). Both match the
+analytics queries on the bookings table, so the two read paths agree.
+
+Backfill from the command line:
+    python -m app.scripts.rebuild_daily_stats
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    select, insert, update, delete, exists, and_, case, func, cast, literal,
+    bindparam, union_all, Float, Numeric
+)
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.booking import Booking, BookingStatus
+from app.models.daily_stats import DailyStats
+from app.models.inventory import Inventory
+from app.models.inventory_archive import InventoryArchive
+from app.models.room_type import RoomType
+from app.utils.date_utils import count_nights, sql_days_between, sql_date_series
+
+# Columns changed by booking mutations (capacity is maintained separately)
+ARRIVAL_STAT_COLUMNS = (
+    "bookings",
+    "confirmed_bookings",
+    "cancellations",
+    "rooms_sold",
+    "room_nights_sold",
+    "revenue",
+    "rooms_reserved"
+)
+NIGHT_STAT_COLUMNS = (
+    "stays",
+    "confirmed_stays",
+    "cancelled_stays",
+    "rooms_occupied",
+    "night_revenue",
+    "rooms_in_house"
+)
+BOOKING_STAT_COLUMNS = ARRIVAL_STAT_COLUMNS + NIGHT_STAT_COLUMNS
+
+# Per-night revenue share: total_amount / nights rounded half up to 4 places
+NIGHT_REVENUE_SCALE = 4
+NIGHT_REVENUE_QUANTUM = Decimal(1).scaleb(-NIGHT_REVENUE_SCALE)
+
+
+def sql_night_revenue(dialect_name: str, nights: ColumnElement) -> ColumnElement:
+    """
+    SQL expression for the revenue a booking adds to each night of its stay,
+    rounded like the rollup's incremental updates.
+    
+    The division runs in NUMERIC arithmetic. SQLite stores whole amounts as
+    integers and would truncate a NUMERIC division, so it divides as REAL.
+    
+    Args:
+        dialect_name: SQLAlchemy dialect name (sqlite, postgresql, ...)
+        nights: Number of nights expression (e.g. from sql_days_between)
+    
+    Returns:
+        Numeric SQL expression
+    """
+    divisor_type = Float if dialect_name == "sqlite" else Numeric(12, NIGHT_REVENUE_SCALE)
+    return func.round(Booking.total_amount / cast(nights, divisor_type), NIGHT_REVENUE_SCALE)
+
+
+class BookingSnapshot(NamedTuple):
+    """The booking fields that feed the rollup, captured before/after a change."""
+    room_type_id: int
+    check_in: date
+    check_out: date
+    num_rooms: int
+    total_amount: Decimal
+    status: str
+
+
+def snapshot_booking(booking: Booking) -> BookingSnapshot:
+    """Capture the rollup-relevant fields of a booking."""
+    return BookingSnapshot(
+        room_type_id=booking.room_type_id,
+        check_in=booking.check_in,
+        check_out=booking.check_out,
+        num_rooms=booking.num_rooms,
+        total_amount=Decimal(booking.total_amount),
+        status=booking.status
+    )
+
+
+def _booking_contributions(
+    snapshot: BookingSnapshot
+) -> Iterator[Tuple[date, Dict[str, object]]]:
+    """
+    Values a single booking adds to the rollup, per date.
+    
+    Yields the arrival values for check_in, then the night values for every
+    night of the stay (revenue spread evenly over the nights).
+    """
+    confirmed = snapshot.status == BookingStatus.CONFIRMED.value
+    cancelled = snapshot.status == BookingStatus.CANCELLED.value
+    nights = count_nights(snapshot.check_in, snapshot.check_out)
+    
+    yield snapshot.check_in, {
+        "bookings": 1,
+        "confirmed_bookings": 1 if confirmed else 0,
+        "cancellations": 1 if cancelled else 0,
+        "rooms_sold": snapshot.num_rooms if confirmed else 0,
+        "room_nights_sold": snapshot.num_rooms * nights if confirmed else 0,
+        "revenue": snapshot.total_amount if confirmed else Decimal(0),
+        "rooms_reserved": 0 if cancelled else snapshot.num_rooms
+    }
+    
+    if nights <= 0:
+        return
+    
+    night_values = {
+        "stays": 1,
+        "confirmed_stays": 1 if confirmed else 0,
+        "cancelled_stays": 1 if cancelled else 0,
+        "rooms_occupied": snapshot.num_rooms if confirmed else 0,
+        "night_revenue": (
+            (snapshot.total_amount / nights).quantize(
+                NIGHT_REVENUE_QUANTUM, rounding=ROUND_HALF_UP
+            )
+            if confirmed else Decimal(0)
+        ),
+        "rooms_in_house": 0 if cancelled else snapshot.num_rooms
+    }
+    for offset in range(nights):
+        yield snapshot.check_in + timedelta(days=offset), night_values
+
+
+async def record_booking_change(
+    db: AsyncSession,
+    before: Optional[BookingSnapshot],
+    after: Optional[BookingSnapshot]
+) -> None:
+    """
+    Apply the difference between two booking states to the rollup.
+    
+    Must be called inside the transaction that changes the booking.
+    Pass before=None for a new booking. Nights shared by both states
+    cancel out, so e.g. extending a stay only touches the added nights
+    (plus the check-in row).
+    
+    Args:
+        db: Database session
+        before: Booking state before the change (None if created)
+        after: Booking state after the change (None if removed)
+    """
+    deltas: Dict[Tuple[date, int], Dict[str, object]] = {}
+    
+    for snapshot, sign in ((before, -1), (after, 1)):
+        if snapshot is None:
+            continue
+        
+        for stats_date, values in _booking_contributions(snapshot):
+            key = (stats_date, snapshot.room_type_id)
+            row = deltas.setdefault(key, dict.fromkeys(BOOKING_STAT_COLUMNS, 0))
+            for column, value in values.items():
+                row[column] += sign * value
+    
+    rows = [
+        {
+            "p_date": stats_date,
+            "p_room_type_id": room_type_id,
+            **{f"p_{column}": value for column, value in values.items()}
+        }
+        for (stats_date, room_type_id), values in deltas.items()
+        if any(values.values())
+    ]
+    if rows:
+        await _upsert_stats_rows(db, rows)
+
+
+async def _upsert_stats_rows(db: AsyncSession, rows: List[Dict[str, object]]) -> None:
+    """
+    Add values to rollup rows, creating them on first use.
+    
+    One executemany INSERT ... ON CONFLICT DO UPDATE on PostgreSQL and
+    SQLite; UPDATE, then INSERT if nothing matched, per row elsewhere.
+    
+    Args:
+        db: Database session
+        rows: Parameter dicts: p_date, p_room_type_id and p_<column> for
+            every BOOKING_STAT_COLUMNS entry
+    """
+    table = DailyStats.__table__
+    capacity = func.coalesce(
+        select(RoomType.total_rooms)
+        .where(RoomType.id == bindparam("p_room_type_id"))
+        .scalar_subquery(),
+        0
+    )
+    insert_values = {
+        "date": bindparam("p_date"),
+        "room_type_id": bindparam("p_room_type_id"),
+        "capacity": capacity,
+        **{column: bindparam(f"p_{column}") for column in BOOKING_STAT_COLUMNS}
+    }
+    dialect_name = db.get_bind().dialect.name
+    
+    if dialect_name in ("postgresql", "sqlite"):
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        
+        stmt = dialect_insert(table).values(insert_values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["date", "room_type_id"],
+            set_={
+                column: table.c[column] + stmt.excluded[column]
+                for column in BOOKING_STAT_COLUMNS
+            }
+        )
+        await db.execute(stmt, rows)
+        return
+    
+    update_stmt = (
+        update(table)
+        .where(
+            and_(
+                table.c.date == bindparam("p_date"),
+                table.c.room_type_id == bindparam("p_room_type_id")
+            )
+        )
+        .values({
+            column: table.c[column] + bindparam(f"p_{column}")
+            for column in BOOKING_STAT_COLUMNS
+        })
+    )
+    for row in rows:
+        result = await db.execute(update_stmt, row)
+        if result.rowcount == 0:
+            await db.execute(insert(table).values(insert_values), row)
+
+
+async def seed_capacity_rows(
+    db: AsyncSession,
+    rows: Iterable[Tuple[int, date, int]]
+) -> None:
+    """
+    Create empty rollup rows for newly generated inventory.
+    
+    Args:
+        db: Database session
+        rows: (room_type_id, date, total_rooms) tuples
+    """
+    values = [
+        {"room_type_id": room_type_id, "date": stats_date, "capacity": total_rooms}
+        for room_type_id, stats_date, total_rooms in rows
+    ]
+    if not values:
+        return
+    
+    dialect_name = db.get_bind().dialect.name
+    
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(DailyStats).on_conflict_do_nothing(
+            index_elements=["date", "room_type_id"]
+        )
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(DailyStats).on_conflict_do_nothing(
+            index_elements=["date", "room_type_id"]
+        )
+    else:
+        stmt = insert(DailyStats)
+    
+    await db.execute(stmt, values)
+
+
+async def update_capacity(db: AsyncSession, room_type_id: int, total_rooms: int) -> None:
+    """Apply a changed total_rooms to today's and future rollup rows."""
+    await db.execute(
+        update(DailyStats)
+        .where(
+            and_(
+                DailyStats.room_type_id == room_type_id,
+                DailyStats.date >= date.today()
+            )
+        )
+        .values(capacity=total_rooms)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def delete_room_type_stats(db: AsyncSession, room_type_id: int) -> None:
+    """Drop the rollup rows of a deleted room type."""
+    await db.execute(
+        delete(DailyStats)
+        .where(DailyStats.room_type_id == room_type_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def rebuild_daily_stats(db: AsyncSession) -> int:
+    """
+    Recompute the whole rollup from bookings and (archived) inventory.
+    
+    Runs as set-based statements in one transaction: one grouped
+    INSERT ... SELECT over the union of per-arrival aggregates and per-night
+    aggregates (bookings joined to a generated date series), then
+    capacity-only rows for inventory dates without bookings.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Number of rollup rows
+    """
+    dialect_name = db.get_bind().dialect.name
+    confirmed = Booking.status == BookingStatus.CONFIRMED.value
+    cancelled = Booking.status == BookingStatus.CANCELLED.value
+    nights = sql_days_between(dialect_name, Booking.check_in, Booking.check_out)
+    zero = literal(0)
+    
+    await db.execute(delete(DailyStats).execution_options(synchronize_session=False))
+    
+    result = await db.execute(
+        select(func.min(Booking.check_in), func.max(Booking.check_out))
+    )
+    first_night, last_check_out = result.one()
+    
+    if first_night is not None:
+        arrivals = (
+            select(
+                Booking.check_in.label("date"),
+                Booking.room_type_id.label("room_type_id"),
+                func.count(Booking.id).label("bookings"),
+                func.sum(case((confirmed, 1), else_=0)).label("confirmed_bookings"),
+                func.sum(case((cancelled, 1), else_=0)).label("cancellations"),
+                func.sum(case((confirmed, Booking.num_rooms), else_=0)).label("rooms_sold"),
+                func.sum(case((confirmed, Booking.num_rooms * nights), else_=0)).label("room_nights_sold"),
+                func.sum(case((confirmed, Booking.total_amount), else_=0)).label("revenue"),
+                func.sum(case((cancelled, 0), else_=Booking.num_rooms)).label("rooms_reserved"),
+                *(zero.label(column) for column in NIGHT_STAT_COLUMNS)
+            )
+            .group_by(Booking.check_in, Booking.room_type_id)
+        )
+        
+        series = sql_date_series(dialect_name, first_night, last_check_out - timedelta(days=1))
+        stays = (
+            select(
+                series.c.night,
+                Booking.room_type_id,
+                *(zero for _ in ARRIVAL_STAT_COLUMNS),
+                func.count(Booking.id),
+                func.sum(case((confirmed, 1), else_=0)),
+                func.sum(case((cancelled, 1), else_=0)),
+                func.sum(case((confirmed, Booking.num_rooms), else_=0)),
+                func.sum(case((confirmed, sql_night_revenue(dialect_name, nights)), else_=0)),
+                func.sum(case((cancelled, 0), else_=Booking.num_rooms))
+            )
+            .select_from(series)
+            .join(
+                Booking,
+                and_(
+                    Booking.check_in <= series.c.night,
+                    Booking.check_out > series.c.night
+                )
+            )
+            .group_by(series.c.night, Booking.room_type_id)
+        )
+        
+        combined = union_all(arrivals, stays).subquery()
+        
+        await db.execute(
+            insert(DailyStats).from_select(
+                ["date", "room_type_id", "capacity", *BOOKING_STAT_COLUMNS],
+                select(
+                    combined.c.date,
+                    combined.c.room_type_id,
+                    RoomType.total_rooms,
+                    *(func.sum(combined.c[column]) for column in BOOKING_STAT_COLUMNS)
+                )
+                .join(RoomType, combined.c.room_type_id == RoomType.id)
+                .group_by(combined.c.date, combined.c.room_type_id, RoomType.total_rooms)
+            )
+        )
+    
+    for source in (Inventory, InventoryArchive):
+        await db.execute(
+            insert(DailyStats).from_select(
+                ["date", "room_type_id", "capacity"],
+                select(source.date, source.room_type_id, RoomType.total_rooms)
+                .join(RoomType, source.room_type_id == RoomType.id)
+                .where(
+                    ~exists().where(
+                        and_(
+                            DailyStats.date == source.date,
+                            DailyStats.room_type_id == source.room_type_id
+                        )
+                    )
+                )
+            )
+        )
+    
+    result = await db.execute(select(func.count(DailyStats.id)))
+    count = result.scalar_one()
+    
+    await db.commit()
+    return count
+
@@ -0,0 +1,172 @@
+"""
+Inventory maintenance service for keeping the booking horizon rolling.
+
+Responsibilities:
+- Extend inventory to INVENTORY_DAYS_AHEAD for every room type (daily)
+- Optionally move past-dated inventory into inventory_archive
+- Run both steps periodically as a background task started from lifespan
+"""
+
+import asyncio
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, delete, func, and_, or_
+
+from app.core.config import get_settings
+from app.core.database import async_session_maker
+from app.models.inventory import Inventory
+from app.models.inventory_archive import InventoryArchive
+from app.services.inventory_service import generate_inventory_for_all_room_types
+
+settings = get_settings()
+
+
+def get_archive_cutoff() -> Optional[date]:
+    """
+    Get the first date still kept in the hot inventory table.
+    
+    Returns:
+        Cutoff date, or None when archival is disabled
+    """
+    if not settings.INVENTORY_ARCHIVE_ENABLED:
+        return None
+    
+    return date.today() - timedelta(days=settings.INVENTORY_ARCHIVE_AFTER_DAYS)
+
+
+async def count_archived_nights(
+    db: AsyncSession,
+    nights: Iterable[Tuple[int, date]]
+) -> int:
+    """
+    Count how many of the given nights live in inventory_archive.
+    
+    Read in the caller's transaction, so the answer is consistent with the
+    inventory rows the caller just updated (archival moves rows in one
+    transaction). Only past nights can be archived; when there are none no
+    query is issued.
+    
+    Args:
+        db: Database session
+        nights: (room_type_id, date) pairs
+    
+    Returns:
+        Number of archived nights
+    """
+    today = date.today()
+    dates_by_room_type: Dict[int, List[date]] = {}
+    for room_type_id, night in nights:
+        if night < today:
+            dates_by_room_type.setdefault(room_type_id, []).append(night)
+    
+    if not dates_by_room_type:
+        return 0
+    
+    result = await db.execute(
+        select(func.count(InventoryArchive.id))
+        .where(
+            or_(*(
+                and_(
+                    InventoryArchive.room_type_id == room_type_id,
+                    InventoryArchive.date.in_(dates)
+                )
+                for room_type_id, dates in dates_by_room_type.items()
+            ))
+        )
+    )
+    return result.scalar_one()
+
+
+async def extend_inventory_horizon(db: AsyncSession) -> int:
+    """
+    Append the missing day(s) at the end of the horizon for every room type.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Number of inventory records created
+    """
+    return await generate_inventory_for_all_room_types(
+        db, settings.INVENTORY_DAYS_AHEAD
+    )
+
+
+async def archive_past_inventory(db: AsyncSession) -> int:
+    """
+    Move inventory rows dated before the archive cutoff into inventory_archive.
+    
+    Copy and delete run as two set-based statements in one transaction.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Number of inventory records archived
+    """
+    cutoff = get_archive_cutoff()
+    
+    if cutoff is None:
+        return 0
+    
+    columns = [
+        "id",
+        "room_type_id",
+        "date",
+        "available_rooms",
+        "price",
+        "created_at",
+        "updated_at"
+    ]
+    
+    await db.execute(
+        insert(InventoryArchive).from_select(
+            columns,
+            select(*(getattr(Inventory, column) for column in columns))
+            .where(Inventory.date < cutoff)
+        )
+    )
+    result = await db.execute(
+        delete(Inventory)
+        .where(Inventory.date < cutoff)
+        .execution_options(synchronize_session=False)
+    )
+    
+    await db.commit()
+    return result.rowcount
+
+
+async def run_inventory_maintenance() -> dict:
+    """
+    Run one maintenance pass in its own session.
+    
+    Returns:
+        Dictionary with created and archived record counts
+    """
+    async with async_session_maker() as db:
+        created = await extend_inventory_horizon(db)
+        archived = await archive_past_inventory(db)
+    
+    return {"created": created, "archived": archived}
+
+
+async def inventory_maintenance_loop() -> None:
+    """
+    Background task: run maintenance now and then every configured interval.
+    Failures are logged and retried on the next tick.
+    """
+    interval_seconds = settings.INVENTORY_MAINTENANCE_INTERVAL_HOURS * 3600
+    
+    while True:
+        try:
+            stats = await run_inventory_maintenance()
+            print(
+                f"🗓️  Inventory maintenance: {stats['created']} created, "
+                f"{stats['archived']} archived"
+            )
+        except Exception as e:
+            # Log the error (in production, use proper logging)
+            print(f"Inventory maintenance error: {e}")
+        
+        await asyncio.sleep(interval_seconds)
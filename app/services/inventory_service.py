@@ -8,18 +8,23 @@ TRANSACTION SAFETY:
 - SQLite fallback is serialized via single-connection
 """
 
+from collections import deque
 from datetime import date, timedelta
-from typing import List, Optional, Tuple
+from itertools import groupby
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, update, and_, or_, case, func
 from sqlalchemy.orm import selectinload
 
 from app.models.inventory import Inventory
 from app.models.room_type import RoomType
-from app.schemas.inventory import InventoryAvailability, DateRangeAvailability
-from app.utils.date_utils import get_date_list, get_future_dates
+from app.schemas.inventory import InventoryRead, InventoryAvailability, DateRangeAvailability, AvailableStay
+from app.services.availability_index import availability_index
+from app.services.daily_stats_service import seed_capacity_rows
+from app.utils.date_utils import get_date_range, get_date_list, get_future_dates, count_nights
 from app.core.config import get_settings
+from app.core.database import stream_query
 from app.core.exceptions import (
     InventoryUnavailableError,
     InventoryNotFoundError,
@@ -33,6 +38,116 @@ settings = get_settings()
 # INVENTORY GENERATION
 # =============================================================================
 
+# Rows per executemany batch when inserting generated inventory
+INVENTORY_INSERT_BATCH_SIZE = 1000
+
+
+async def _insert_inventory_rows(db: AsyncSession, rows: List[dict]) -> int:
+    """
+    Bulk insert inventory rows in batched executemany calls.
+    
+    On PostgreSQL and SQLite the insert uses ON CONFLICT DO NOTHING against
+    uq_room_type_date, so a concurrent generator cannot fail the batch.
+    Inserted rows are counted with RETURNING (executemany rowcounts are not
+    reported by every driver, e.g. asyncpg).
+    
+    Args:
+        db: Database session
+        rows: Column dicts (room_type_id, date, available_rooms, price)
+    
+    Returns:
+        Number of rows actually inserted (conflicting rows are skipped)
+    """
+    dialect_name = db.get_bind().dialect.name
+    skips_conflicts = dialect_name in ("postgresql", "sqlite")
+    
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(Inventory).on_conflict_do_nothing(
+            index_elements=["room_type_id", "date"]
+        ).returning(Inventory.id)
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(Inventory).on_conflict_do_nothing(
+            index_elements=["room_type_id", "date"]
+        ).returning(Inventory.id)
+    else:
+        stmt = insert(Inventory)
+    
+    inserted = 0
+    for offset in range(0, len(rows), INVENTORY_INSERT_BATCH_SIZE):
+        batch = rows[offset:offset + INVENTORY_INSERT_BATCH_SIZE]
+        result = await db.execute(stmt, batch)
+        # Without ON CONFLICT a duplicate fails the batch, so all rows landed
+        inserted += len(result.all()) if skips_conflicts else len(batch)
+    
+    return inserted
+
+
+async def _generate_missing_inventory(
+    db: AsyncSession,
+    room_types: List[RoomType],
+    days: int
+) -> int:
+    """
+    Insert inventory for every (room type, date) pair in the next N days
+    that doesn't exist yet.
+    
+    Existing dates are fetched with one query for all room types instead of
+    probing each date individually.
+    
+    Args:
+        db: Database session
+        room_types: Room types to generate inventory for
+        days: Number of days to generate
+    
+    Returns:
+        Number of inventory records created
+    """
+    if not room_types or days <= 0:
+        return 0
+    
+    dates = get_future_dates(days)
+    
+    result = await db.execute(
+        select(Inventory.room_type_id, Inventory.date)
+        .where(
+            and_(
+                Inventory.room_type_id.in_([rt.id for rt in room_types]),
+                Inventory.date >= dates[0],
+                Inventory.date <= dates[-1]
+            )
+        )
+    )
+    existing = set(result.tuples().all())
+    
+    rows = [
+        {
+            "room_type_id": rt.id,
+            "date": inv_date,
+            "available_rooms": rt.total_rooms,
+            "price": rt.base_price
+        }
+        for rt in room_types
+        for inv_date in dates
+        if (rt.id, inv_date) not in existing
+    ]
+    
+    if not rows:
+        return 0
+    
+    # A concurrent generator may have inserted some of the rows meanwhile
+    created = await _insert_inventory_rows(db, rows)
+    await seed_capacity_rows(db, (
+        (row["room_type_id"], row["date"], row["available_rooms"])
+        for row in rows
+    ))
+    if created:
+        availability_index.record_invalidate(db)
+    
+    return created
+
+
 async def generate_inventory(
     db: AsyncSession,
     room_type_id: int,
@@ -59,34 +174,37 @@ async def generate_inventory(
     if not room_type:
         return 0
     
-    dates = get_future_dates(days)
-    created_count = 0
-    
-    for inv_date in dates:
-        # Check if inventory already exists for this date
-        existing = await db.execute(
-            select(Inventory).where(
-                and_(
-                    Inventory.room_type_id == room_type_id,
-                    Inventory.date == inv_date
-                )
-            )
-        )
-        
-        if existing.scalar_one_or_none() is None:
-            inventory = Inventory(
-                room_type_id=room_type_id,
-                date=inv_date,
-                available_rooms=room_type.total_rooms,
-                price=room_type.base_price
-            )
-            db.add(inventory)
-            created_count += 1
+    created_count = await _generate_missing_inventory(db, [room_type], days)
     
     await db.flush()  # Flush within current transaction
     return created_count
 
 
+async def generate_inventory_for_all_room_types(
+    db: AsyncSession,
+    days_ahead: int = None
+) -> int:
+    """
+    Generate missing inventory for every room type in one pass and commit.
+    
+    Args:
+        db: Database session
+        days_ahead: Number of days to generate (defaults to config value)
+    
+    Returns:
+        Number of inventory records created
+    """
+    if days_ahead is None:
+        days_ahead = settings.INVENTORY_DAYS_AHEAD
+    
+    result = await db.execute(select(RoomType))
+    room_types = list(result.scalars().all())
+    
+    count = await _generate_missing_inventory(db, room_types, days_ahead)
+    await db.commit()
+    return count
+
+
 async def generate_inventory_for_room_type(
     db: AsyncSession,
     room_type: RoomType,
@@ -113,72 +231,153 @@ async def generate_inventory_for_room_type(
 
 
 # =============================================================================
-# AVAILABILITY CHECKING
+# AVAILABILITY SEARCH (FLEXIBLE DATES / ALTERNATIVE ROOMS)
 # =============================================================================
 
-async def check_availability(
+async def search_available_stays(
     db: AsyncSession,
-    room_type_id: int,
-    start_date: date,
-    end_date: date,
-    num_rooms: int = 1
-) -> Tuple[bool, int, Decimal]:
+    check_in: date,
+    num_nights: int,
+    num_rooms: int = 1,
+    flex_days: int = 7,
+    room_type_id: Optional[int] = None,
+    limit: int = 20
+) -> List[AvailableStay]:
     """
-    Check if rooms are available for all dates in the range.
-    Does NOT lock rows - use for read-only availability queries.
+    Find bookable (room type, check-in) combinations around a preferred date.
+    
+    One bulk inventory read covers every candidate stay; each room type is
+    then scanned once with a sliding window (monotonic deque for the
+    minimum, running sum for the price, running count for missing days).
     
     Args:
         db: Database session
-        room_type_id: ID of the room type
-        start_date: Check-in date (inclusive)
-        end_date: Check-out date (exclusive)
+        check_in: Preferred check-in date
+        num_nights: Length of the stay
         num_rooms: Number of rooms needed
+        flex_days: Check-in may move this many days earlier or later
+        room_type_id: Optional room type filter
+        limit: Maximum number of results
     
     Returns:
-        Tuple of (is_available, min_available_rooms, total_price)
+        Available stays ordered by total price, then distance from the
+        preferred check-in date
     
     Raises:
-        InvalidDateRangeError: If date range is invalid
-        InventoryNotFoundError: If inventory doesn't exist for dates
+        InvalidDateRangeError: If the stay length is invalid
     """
-    # Validate date range
-    if end_date <= start_date:
-        raise InvalidDateRangeError("Check-out date must be after check-in date")
+    if num_nights < 1:
+        raise InvalidDateRangeError("Stay must be at least one night")
     
-    if start_date < date.today():
-        raise InvalidDateRangeError("Check-in date cannot be in the past")
+    # Candidate check-ins (never in the past)
+    first_check_in = max(check_in - timedelta(days=flex_days), date.today())
+    last_check_in = check_in + timedelta(days=flex_days)
     
-    required_dates = get_date_list(start_date, end_date)
+    if last_check_in < first_check_in:
+        return []
     
-    # Query inventory for date range
-    result = await db.execute(
-        select(Inventory)
+    window_end = last_check_in + timedelta(days=num_nights)
+    window_days = (window_end - first_check_in).days
+    
+    query = (
+        select(
+            RoomType.id,
+            RoomType.name,
+            Inventory.date,
+            Inventory.available_rooms,
+            Inventory.price
+        )
+        .join(Inventory, Inventory.room_type_id == RoomType.id)
         .where(
             and_(
-                Inventory.room_type_id == room_type_id,
-                Inventory.date >= start_date,
-                Inventory.date < end_date
+                Inventory.date >= first_check_in,
+                Inventory.date < window_end
             )
         )
-        .order_by(Inventory.date)
     )
-    inventory_records = list(result.scalars().all())
+    if room_type_id:
+        query = query.where(RoomType.id == room_type_id)
     
-    # Check if we have inventory for all required dates
-    inventory_dates = {inv.date for inv in inventory_records}
-    missing_dates = [d for d in required_dates if d not in inventory_dates]
+    result = await db.execute(query)
     
-    if missing_dates:
-        raise InventoryNotFoundError(
-            f"No inventory found for dates: {missing_dates[0]} to {missing_dates[-1]}"
-        )
+    # Per room type: name, available rooms and price by day offset (None = missing)
+    room_types: Dict[int, Tuple[str, list, list]] = {}
+    for row in result.all():
+        if row.id not in room_types:
+            room_types[row.id] = (row.name, [None] * window_days, [None] * window_days)
+        _, available, prices = room_types[row.id]
+        offset = (row.date - first_check_in).days
+        available[offset] = row.available_rooms
+        prices[offset] = row.price
     
-    # Calculate availability
-    min_available = min(inv.available_rooms for inv in inventory_records)
-    total_price = sum(inv.price for inv in inventory_records) * num_rooms
-    is_available = min_available >= num_rooms
+    stays = []
+    for rt_id, (name, available, prices) in room_types.items():
+        for offset, min_available, total_price in _sliding_stay_windows(
+            available, prices, num_nights
+        ):
+            if min_available < num_rooms:
+                continue
+            
+            stay_check_in = first_check_in + timedelta(days=offset)
+            stays.append(AvailableStay(
+                room_type_id=rt_id,
+                room_type_name=name,
+                check_in=stay_check_in,
+                check_out=stay_check_in + timedelta(days=num_nights),
+                num_nights=num_nights,
+                num_rooms=num_rooms,
+                min_available=min_available,
+                total_price=total_price * num_rooms,
+                days_from_requested=(stay_check_in - check_in).days
+            ))
     
-    return is_available, min_available, total_price
+    stays.sort(key=lambda stay: (
+        stay.total_price,
+        abs(stay.days_from_requested),
+        stay.check_in,
+        stay.room_type_id
+    ))
+    return stays[:limit]
+
+
+def _sliding_stay_windows(
+    available: List[Optional[int]],
+    prices: List[Optional[Decimal]],
+    num_nights: int
+):
+    """
+    Yield (start offset, min available, total price) for every window of
+    num_nights consecutive days that has inventory on each day.
+    """
+    min_window = deque()  # offsets with increasing available_rooms
+    price_sum = Decimal("0")
+    missing = 0
+    
+    for i in range(len(available)):
+        # Add day i
+        if available[i] is None:
+            missing += 1
+        else:
+            price_sum += prices[i]
+            while min_window and available[min_window[-1]] >= available[i]:
+                min_window.pop()
+            min_window.append(i)
+        
+        start = i - num_nights + 1
+        if start < 0:
+            continue
+        
+        # Drop day start - 1
+        if start > 0:
+            if available[start - 1] is None:
+                missing -= 1
+            else:
+                price_sum -= prices[start - 1]
+        while min_window and min_window[0] < start:
+            min_window.popleft()
+        
+        if missing == 0:
+            yield start, available[min_window[0]], price_sum
 
 
 # =============================================================================
@@ -208,52 +407,128 @@ async def reserve_inventory(
     Returns:
         Total price for the reservation
     
+    Raises:
+        InventoryNotFoundError: If inventory doesn't exist for a date
+        InventoryUnavailableError: If not enough rooms available
+    """
+    prices = await reserve_inventory_multi(
+        db,
+        {room_type_id: num_rooms},
+        start_date,
+        end_date
+    )
+    return prices[room_type_id]
+
+
+async def reserve_inventory_multi(
+    db: AsyncSession,
+    room_quantities: Dict[int, int],
+    start_date: date,
+    end_date: date
+) -> Dict[int, Decimal]:
+    """
+    Reserve (deduct) inventory for several room types over the same stay.
+    
+    CRITICAL: This function MUST be called within an active transaction.
+    All (room_type_id, date) rows are locked with ONE SELECT FOR UPDATE and
+    deducted with ONE conditional UPDATE, regardless of stay length or the
+    number of room types.
+    
+    Args:
+        db: Database session (must be in a transaction)
+        room_quantities: Mapping of room_type_id to number of rooms
+        start_date: Check-in date (inclusive)
+        end_date: Check-out date (exclusive)
+    
+    Returns:
+        Mapping of room_type_id to total price for its rooms
+    
     Raises:
         InventoryNotFoundError: If inventory doesn't exist for a date
         InventoryUnavailableError: If not enough rooms available
     """
     required_dates = get_date_list(start_date, end_date)
-    total_price = Decimal("0.00")
+    room_type_ids = list(room_quantities)
     
-    for booking_date in required_dates:
-        # SELECT FOR UPDATE: Locks the row to prevent concurrent modifications
-        # This is the key to preventing overbooking race conditions
-        result = await db.execute(
-            select(Inventory)
-            .where(
-                and_(
-                    Inventory.room_type_id == room_type_id,
-                    Inventory.date == booking_date
-                )
+    # SELECT FOR UPDATE: Locks the whole (room_type_id, date) range in a
+    # single statement instead of one round trip per night.
+    # This is the key to preventing overbooking race conditions
+    result = await db.execute(
+        select(
+            Inventory.room_type_id,
+            Inventory.date,
+            Inventory.available_rooms,
+            Inventory.price
+        )
+        .where(
+            and_(
+                Inventory.room_type_id.in_(room_type_ids),
+                Inventory.date >= start_date,
+                Inventory.date < end_date
             )
-            .with_for_update()  # Row-level lock (PostgreSQL)
         )
-        inventory = result.scalar_one_or_none()
+        .order_by(Inventory.room_type_id, Inventory.date)
+        .with_for_update()  # Row-level lock (PostgreSQL)
+    )
+    inventory_by_key = {(row.room_type_id, row.date): row for row in result}
+    
+    # Validate every night (CRITICAL: Must check AFTER locking)
+    # Dates are checked in order so the first short night is reported
+    prices = {}
+    for room_type_id in room_type_ids:
+        num_rooms = room_quantities[room_type_id]
+        total_price = Decimal("0.00")
         
-        # Validate inventory exists
-        if inventory is None:
-            raise InventoryNotFoundError(
-                f"No inventory available for date {booking_date}"
-            )
+        for booking_date in required_dates:
+            inventory = inventory_by_key.get((room_type_id, booking_date))
+            
+            if inventory is None:
+                raise InventoryNotFoundError(
+                    f"No inventory available for date {booking_date}"
+                )
+            
+            if inventory.available_rooms < num_rooms:
+                raise InventoryUnavailableError(
+                    f"Only {inventory.available_rooms} room(s) available on {booking_date}, "
+                    f"requested {num_rooms}",
+                    date=str(booking_date),
+                    room_type_id=room_type_id
+                )
+            
+            total_price += inventory.price
         
-        # Validate availability (CRITICAL: Must check AFTER locking)
-        if inventory.available_rooms < num_rooms:
-            raise InventoryUnavailableError(
-                f"Only {inventory.available_rooms} room(s) available on {booking_date}, "
-                f"requested {num_rooms}",
-                date=str(booking_date)
+        prices[room_type_id] = total_price * num_rooms
+    
+    # Deduct all nights of all room types with one conditional UPDATE
+    # (no negative values allowed)
+    requested = case(room_quantities, value=Inventory.room_type_id)
+    result = await db.execute(
+        update(Inventory)
+        .where(
+            and_(
+                Inventory.room_type_id.in_(room_type_ids),
+                Inventory.date >= start_date,
+                Inventory.date < end_date,
+                Inventory.available_rooms >= requested
             )
-        
-        # Deduct inventory (no negative values allowed)
-        inventory.available_rooms -= num_rooms
-        assert inventory.available_rooms >= 0, "Inventory cannot be negative"
-        
-        # Accumulate price
-        total_price += inventory.price * num_rooms
+        )
+        .values(available_rooms=Inventory.available_rooms - requested)
+        .execution_options(synchronize_session="fetch")
+    )
+    
+    # Backends without row locks (SQLite) can race between the read and the
+    # UPDATE; the guard above skips short rows, so a mismatch means a conflict
+    if result.rowcount != len(required_dates) * len(room_type_ids):
+        raise InventoryUnavailableError(
+            f"Inventory changed while reserving {start_date} to {end_date}"
+        )
+    
+    for room_type_id, num_rooms in room_quantities.items():
+        availability_index.record_delta(db, room_type_id, required_dates, -num_rooms)
     
     # Changes are flushed but NOT committed - caller manages transaction
     await db.flush()
-    return total_price
+    return prices
 
 
 async def restore_inventory(
@@ -262,44 +537,315 @@ async def restore_inventory(
     start_date: date,
     end_date: date,
     num_rooms: int = 1
-) -> None:
+) -> int:
     """
     Restore inventory when a booking is cancelled.
     Should be called within a transaction.
     
+    All nights are restored with a single UPDATE (the UPDATE itself takes
+    the row locks), capped at the room type's total_rooms.
+    
     Args:
         db: Database session
         room_type_id: ID of the room type
         start_date: Check-in date (inclusive)
         end_date: Check-out date (exclusive)
         num_rooms: Number of rooms to restore
+    
+    Returns:
+        Number of inventory rows touched. Callers compare this against the
+        number of nights to detect missing inventory.
     """
-    required_dates = get_date_list(start_date, end_date)
+    restored = await _restore_rows(
+        db,
+        room_type_id,
+        and_(Inventory.date >= start_date, Inventory.date < end_date),
+        num_rooms
+    )
+    availability_index.record_delta(
+        db, room_type_id, get_date_range(start_date, end_date), num_rooms
+    )
+    
+    await db.flush()
+    return restored
+
+
+async def _restore_rows(
+    db: AsyncSession,
+    room_type_id: int,
+    date_filter,
+    num_rooms: int
+) -> int:
+    """
+    Increment available_rooms for the matching dates with one UPDATE,
+    capped at the room type's total_rooms.
+    
+    Args:
+        db: Database session
+        room_type_id: ID of the room type
+        date_filter: SQL condition selecting the dates to restore
+        num_rooms: Number of rooms to restore per date
+    
+    Returns:
+        Number of inventory rows touched
+    """
+    total_rooms = (
+        select(RoomType.total_rooms)
+        .where(RoomType.id == room_type_id)
+        .scalar_subquery()
+    )
+    restored = Inventory.available_rooms + num_rooms
+    
+    result = await db.execute(
+        update(Inventory)
+        .where(
+            and_(
+                Inventory.room_type_id == room_type_id,
+                date_filter
+            )
+        )
+        .values(
+            available_rooms=case(
+                (restored > total_rooms, total_rooms),
+                else_=restored
+            )
+        )
+    )
+    return result.rowcount
+
+
+# =============================================================================
+# INVENTORY MODIFICATION (DELTA-BASED)
+# =============================================================================
+
+def diff_stay_inventory(
+    old_room_type_id: int,
+    old_start_date: date,
+    old_end_date: date,
+    old_num_rooms: int,
+    new_room_type_id: int,
+    new_start_date: date,
+    new_end_date: date,
+    new_num_rooms: int
+) -> Dict[Tuple[int, date], int]:
+    """
+    Compute the per-night inventory change needed to move a reservation.
+    
+    Args:
+        old_room_type_id: Room type of the current reservation
+        old_start_date: Current check-in date (inclusive)
+        old_end_date: Current check-out date (exclusive)
+        old_num_rooms: Current number of rooms
+        new_room_type_id: Room type of the new reservation
+        new_start_date: New check-in date (inclusive)
+        new_end_date: New check-out date (exclusive)
+        new_num_rooms: New number of rooms
+    
+    Returns:
+        Mapping of (room_type_id, date) to rooms to reserve (positive)
+        or restore (negative). Unchanged nights are omitted.
+    """
+    changes: Dict[Tuple[int, date], int] = {}
+    
+    for stay_date in get_date_range(old_start_date, old_end_date):
+        key = (old_room_type_id, stay_date)
+        changes[key] = changes.get(key, 0) - old_num_rooms
+    
+    for stay_date in get_date_range(new_start_date, new_end_date):
+        key = (new_room_type_id, stay_date)
+        changes[key] = changes.get(key, 0) + new_num_rooms
+    
+    return {key: delta for key, delta in changes.items() if delta != 0}
+
+
+def _group_dates_by_amount(
+    changes: Dict[Tuple[int, date], int]
+) -> Dict[Tuple[int, int], List[date]]:
+    """Group (room_type_id, date) -> amount into (room_type_id, amount) -> dates."""
+    groups: Dict[Tuple[int, int], List[date]] = {}
+    for (room_type_id, change_date), amount in sorted(changes.items()):
+        groups.setdefault((room_type_id, amount), []).append(change_date)
+    return groups
+
+
+async def apply_inventory_changes(
+    db: AsyncSession,
+    changes: Dict[Tuple[int, date], int]
+) -> int:
+    """
+    Apply per-night inventory changes within a transaction.
+    
+    Only the nights in `changes` are touched: nights needing more rooms are
+    locked with one SELECT FOR UPDATE and checked before anything is written,
+    then each group of equal changes is applied with one UPDATE.
+    
+    CRITICAL: This function MUST be called within an active transaction.
+    
+    Args:
+        db: Database session (must be in a transaction)
+        changes: Mapping of (room_type_id, date) to rooms to reserve
+            (positive) or restore (negative), e.g. from diff_stay_inventory
+    
+    Returns:
+        Number of inventory rows restored
+    
+    Raises:
+        InventoryNotFoundError: If inventory doesn't exist for a date
+        InventoryUnavailableError: If not enough rooms available
+    """
+    reservations = {key: delta for key, delta in changes.items() if delta > 0}
+    restorations = {key: -delta for key, delta in changes.items() if delta < 0}
     
-    for booking_date in required_dates:
-        # Lock row for update
+    if reservations:
+        dates_by_room_type: Dict[int, List[date]] = {}
+        for room_type_id, change_date in reservations:
+            dates_by_room_type.setdefault(room_type_id, []).append(change_date)
+        
+        # SELECT FOR UPDATE: Lock only the nights that need more rooms
         result = await db.execute(
-            select(Inventory)
+            select(
+                Inventory.room_type_id,
+                Inventory.date,
+                Inventory.available_rooms
+            )
             .where(
-                and_(
-                    Inventory.room_type_id == room_type_id,
-                    Inventory.date == booking_date
-                )
+                or_(*(
+                    and_(
+                        Inventory.room_type_id == room_type_id,
+                        Inventory.date.in_(dates)
+                    )
+                    for room_type_id, dates in dates_by_room_type.items()
+                ))
             )
-            .with_for_update()
+            .order_by(Inventory.room_type_id, Inventory.date)
+            .with_for_update()  # Row-level lock (PostgreSQL)
         )
-        inventory = result.scalar_one_or_none()
+        available_by_key = {
+            (row.room_type_id, row.date): row.available_rooms for row in result
+        }
+        
+        # Validate every night (CRITICAL: Must check AFTER locking)
+        for (room_type_id, change_date), num_rooms in sorted(reservations.items()):
+            available = available_by_key.get((room_type_id, change_date))
+            
+            if available is None:
+                raise InventoryNotFoundError(
+                    f"No inventory available for date {change_date}"
+                )
+            
+            if available < num_rooms:
+                raise InventoryUnavailableError(
+                    f"Only {available} room(s) available on {change_date}, "
+                    f"requested {num_rooms} more",
+                    date=str(change_date),
+                    room_type_id=room_type_id
+                )
         
-        if inventory:
-            inventory.available_rooms += num_rooms
+        for (room_type_id, num_rooms), dates in _group_dates_by_amount(reservations).items():
+            result = await db.execute(
+                update(Inventory)
+                .where(
+                    and_(
+                        Inventory.room_type_id == room_type_id,
+                        Inventory.date.in_(dates),
+                        Inventory.available_rooms >= num_rooms
+                    )
+                )
+                .values(available_rooms=Inventory.available_rooms - num_rooms)
+            )
+            
+            if result.rowcount != len(dates):
+                raise InventoryUnavailableError(
+                    f"Inventory changed while reserving {len(dates)} night(s), "
+                    f"requested {num_rooms}"
+                )
+            
+            availability_index.record_delta(db, room_type_id, dates, -num_rooms)
+    
+    restored = 0
+    for (room_type_id, num_rooms), dates in _group_dates_by_amount(restorations).items():
+        restored += await _restore_rows(
+            db,
+            room_type_id,
+            Inventory.date.in_(dates),
+            num_rooms
+        )
+        availability_index.record_delta(db, room_type_id, dates, num_rooms)
     
     await db.flush()
+    return restored
 
 
 # =============================================================================
 # QUERY HELPERS
 # =============================================================================
 
+async def get_stay_price(
+    db: AsyncSession,
+    room_type_id: int,
+    start_date: date,
+    end_date: date,
+    num_rooms: int = 1
+) -> Decimal:
+    """
+    Sum the nightly inventory prices for a stay with one aggregate query.
+    
+    Args:
+        db: Database session
+        room_type_id: ID of the room type
+        start_date: Check-in date (inclusive)
+        end_date: Check-out date (exclusive)
+        num_rooms: Number of rooms
+    
+    Returns:
+        Total price for the stay
+    
+    Raises:
+        InventoryNotFoundError: If inventory doesn't exist for every night
+    """
+    result = await db.execute(
+        select(
+            func.count(Inventory.id).label('nights'),
+            func.sum(Inventory.price).label('price')
+        )
+        .where(
+            and_(
+                Inventory.room_type_id == room_type_id,
+                Inventory.date >= start_date,
+                Inventory.date < end_date
+            )
+        )
+    )
+    stats = result.one()
+    
+    if stats.nights != count_nights(start_date, end_date):
+        raise InventoryNotFoundError(
+            f"No inventory found for all dates: {start_date} to {end_date}"
+        )
+    
+    return Decimal(stats.price) * num_rooms
+
+
+async def get_room_types_by_ids(
+    db: AsyncSession,
+    room_type_ids: List[int]
+) -> Dict[int, RoomType]:
+    """
+    Load several room types with a single IN query.
+    
+    Args:
+        db: Database session
+        room_type_ids: IDs of the room types
+    
+    Returns:
+        Mapping of room_type_id to RoomType (missing IDs are absent)
+    """
+    result = await db.execute(
+        select(RoomType).where(RoomType.id.in_(room_type_ids))
+    )
+    return {rt.id: rt for rt in result.scalars().all()}
+
+
 async def get_inventory_for_date_range(
     db: AsyncSession,
     room_type_id: int,
@@ -332,6 +878,84 @@ async def get_inventory_for_date_range(
     return list(result.scalars().all())
 
 
+async def get_detailed_inventory(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date,
+    room_type_id: Optional[int] = None
+) -> List[InventoryRead]:
+    """
+    Get daily inventory records with room type names (one joined query).
+    
+    Args:
+        db: Database session
+        start_date: Start date (inclusive)
+        end_date: End date (exclusive)
+        room_type_id: Optional room type filter
+    
+    Returns:
+        List of InventoryRead ordered by date, then room type ID
+    """
+    result = await db.execute(
+        _detailed_inventory_query(start_date, end_date, room_type_id)
+    )
+    return [_inventory_read(row) for row in result]
+
+
+async def stream_detailed_inventory(
+    start_date: date,
+    end_date: date,
+    room_type_id: Optional[int] = None
+) -> AsyncIterator[InventoryRead]:
+    """
+    Stream daily inventory records from a server-side cursor in its own
+    session. Same records and ordering as get_detailed_inventory.
+    """
+    query = _detailed_inventory_query(start_date, end_date, room_type_id)
+    async for row in stream_query(query):
+        yield _inventory_read(row)
+
+
+def _detailed_inventory_query(
+    start_date: date,
+    end_date: date,
+    room_type_id: Optional[int] = None
+):
+    query = (
+        select(
+            Inventory.id,
+            Inventory.room_type_id,
+            RoomType.name.label("room_type_name"),
+            Inventory.date,
+            Inventory.available_rooms,
+            Inventory.price
+        )
+        .join(RoomType, Inventory.room_type_id == RoomType.id)
+        .where(
+            and_(
+                Inventory.date >= start_date,
+                Inventory.date < end_date
+            )
+        )
+    )
+    
+    if room_type_id:
+        query = query.where(Inventory.room_type_id == room_type_id)
+    
+    return query.order_by(Inventory.date, Inventory.room_type_id)
+
+
+def _inventory_read(row) -> InventoryRead:
+    return InventoryRead(
+        id=row.id,
+        room_type_id=row.room_type_id,
+        room_type_name=row.room_type_name,
+        date=row.date,
+        available_rooms=row.available_rooms,
+        price=row.price
+    )
+
+
 async def get_availability_summary(
     db: AsyncSession,
     start_date: date,
@@ -341,6 +965,9 @@ async def get_availability_summary(
     """
     Get availability summary for all room types (or a specific one).
     
+    Served from the availability index when enabled, otherwise from one
+    joined scan that streams lightweight row tuples grouped by room type.
+    
     Args:
         db: Database session
         start_date: Start date
@@ -350,45 +977,102 @@ async def get_availability_summary(
     Returns:
         List of availability summaries
     """
-    # Get room types
-    query = select(RoomType)
+    # Serve from the in-memory availability index when possible
+    if await availability_index.ensure_loaded() and availability_index.covers(start_date):
+        return _availability_summary_from_index(start_date, end_date, room_type_id)
+    
+    # Single joined scan ordered by room type, then date
+    query = (
+        select(
+            RoomType.id,
+            RoomType.name,
+            Inventory.date,
+            Inventory.available_rooms,
+            Inventory.price
+        )
+        .join(Inventory, Inventory.room_type_id == RoomType.id)
+        .where(
+            and_(
+                Inventory.date >= start_date,
+                Inventory.date < end_date
+            )
+        )
+        .order_by(RoomType.id, Inventory.date)
+    )
     if room_type_id:
         query = query.where(RoomType.id == room_type_id)
     
     result = await db.execute(query)
-    room_types = result.scalars().all()
     
     summaries = []
     
-    for rt in room_types:
-        inventory_records = await get_inventory_for_date_range(
-            db, rt.id, start_date, end_date
-        )
+    # Build each summary while reading its group of rows
+    for (rt_id, rt_name), rows in groupby(result, key=lambda row: (row.id, row.name)):
+        daily_breakdown = []
+        min_available = None
+        total_price = Decimal("0")
         
-        if not inventory_records:
+        for row in rows:
+            daily_breakdown.append(InventoryAvailability(
+                room_type_id=rt_id,
+                room_type_name=rt_name,
+                date=row.date,
+                available_rooms=row.available_rooms,
+                price=row.price
+            ))
+            if min_available is None or row.available_rooms < min_available:
+                min_available = row.available_rooms
+            total_price += row.price
+        
+        summaries.append(DateRangeAvailability(
+            room_type_id=rt_id,
+            room_type_name=rt_name,
+            start_date=start_date,
+            end_date=end_date,
+            min_available=min_available,
+            total_price=total_price,
+            daily_breakdown=daily_breakdown
+        ))
+    
+    return summaries
+
+
+def _availability_summary_from_index(
+    start_date: date,
+    end_date: date,
+    room_type_id: Optional[int] = None
+) -> List[DateRangeAvailability]:
+    """
+    Build availability summaries from the in-memory availability index.
+    Same shape and ordering as the database path of get_availability_summary.
+    """
+    summaries = []
+    
+    for rt in availability_index.room_types():
+        if room_type_id and rt.room_type_id != room_type_id:
             continue
         
         daily_breakdown = [
             InventoryAvailability(
-                room_type_id=rt.id,
+                room_type_id=rt.room_type_id,
                 room_type_name=rt.name,
-                date=inv.date,
-                available_rooms=inv.available_rooms,
-                price=inv.price
+                date=day,
+                available_rooms=available_rooms,
+                price=price
             )
-            for inv in inventory_records
+            for day, available_rooms, price in rt.daily(start_date, end_date)
         ]
         
-        min_available = min(inv.available_rooms for inv in inventory_records)
-        total_price = sum(inv.price for inv in inventory_records)
+        if not daily_breakdown:
+            continue
         
         summaries.append(DateRangeAvailability(
-            room_type_id=rt.id,
+            room_type_id=rt.room_type_id,
             room_type_name=rt.name,
             start_date=start_date,
             end_date=end_date,
-            min_available=min_available,
-            total_price=total_price,
+            min_available=rt.min_available(start_date, end_date),
+            total_price=rt.total_price(start_date, end_date),
             daily_breakdown=daily_breakdown
         ))
     
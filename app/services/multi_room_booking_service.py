@@ -7,14 +7,13 @@ from datetime import date
 from decimal import Decimal
 from typing import List, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert
 
 from app.models.booking import Booking, BookingStatus
 from app.models.booking_item import BookingItem
-from app.models.room_type import RoomType
-from app.models.customer import Customer
-from app.services.inventory_service import check_availability, reserve_inventory
+from app.services.inventory_service import get_room_types_by_ids, reserve_inventory_multi
 from app.services.booking_service import get_or_create_customer
+from app.services.daily_stats_service import record_booking_change, snapshot_booking
 from app.core.exceptions import (
     InvalidDateRangeError,
     RoomTypeNotFoundError,
@@ -36,11 +35,9 @@ async def create_multi_room_booking(
     
     ATOMIC TRANSACTION FLOW:
     1. Validate dates
-    2. For EACH room type:
-       - Verify room type exists
-       - Check availability
+    2. Verify ALL room types exist (single IN query)
     3. BEGIN TRANSACTION
-       3a. Reserve inventory for ALL room types
+       3a. Check and reserve inventory for ALL room types (locked, set-based)
        3b. Create/update customer
        3c. Create parent booking
        3d. Create child booking_items
@@ -76,55 +73,49 @@ async def create_multi_room_booking(
         raise ValueError("At least one room type must be requested")
     
     # ==========================================================================
-    # STEP 2: Validate and check availability for ALL room types
+    # STEP 2: Load ALL requested room types with one IN query
     # ==========================================================================
-    room_type_prices = {}
-    total_amount = Decimal("0.00")
-    
+    room_quantities = {}
     for room_req in room_requests:
         room_type_id = room_req["room_type_id"]
-        quantity = room_req["quantity"]
-        
-        # Verify room type exists
-        result = await db.execute(
-            select(RoomType).where(RoomType.id == room_type_id)
-        )
-        room_type = result.scalar_one_or_none()
-        
-        if not room_type:
+        room_quantities[room_type_id] = room_quantities.get(room_type_id, 0) + room_req["quantity"]
+    
+    room_types = await get_room_types_by_ids(db, list(room_quantities))
+    
+    for room_type_id in room_quantities:
+        if room_type_id not in room_types:
             raise RoomTypeNotFoundError(room_type_id)
-        
-        # Check availability (read-only)
-        is_available, min_available, price = await check_availability(
-            db,
-            room_type_id,
-            check_in,
-            check_out,
-            quantity
-        )
-        
-        if not is_available:
-            raise InventoryUnavailableError(
-                f"Room type '{room_type.name}': Only {min_available} room(s) available, requested {quantity}"
-            )
-        
-        # Store price per night for this room type
-        room_type_prices[room_type_id] = room_type.base_price
-        total_amount += price
+    
+    # Store price per night for each room type
+    room_type_prices = {
+        room_type_id: room_type.base_price
+        for room_type_id, room_type in room_types.items()
+    }
     
     # ==========================================================================
     # STEP 3: ATOMIC TRANSACTION - Reserve all and create booking
     # ==========================================================================
     async with db.begin_nested():
-        # 3a. Reserve inventory for ALL room types
-        for room_req in room_requests:
-            await reserve_inventory(
+        # 3a. Check and reserve inventory for ALL room types at once
+        # (one locked read + one set-based update)
+        try:
+            prices = await reserve_inventory_multi(
                 db,
-                room_req["room_type_id"],
+                room_quantities,
                 check_in,
-                check_out,
-                room_req["quantity"]
+                check_out
             )
+        except InventoryUnavailableError as e:
+            room_type = room_types.get(e.room_type_id)
+            if room_type is None:
+                raise
+            raise InventoryUnavailableError(
+                f"Room type '{room_type.name}': {e.message}",
+                date=e.date,
+                room_type_id=e.room_type_id
+            )
+        
+        total_amount = sum(prices.values(), Decimal("0.00"))
         
         # 3b. Create/update customer
         customer = await get_or_create_customer(
@@ -152,17 +143,22 @@ async def create_multi_room_booking(
         db.add(booking)
         await db.flush()  # Get booking ID
         
-        # 3d. Create child booking_items
-        for room_req in room_requests:
-            booking_item = BookingItem(
-                booking_id=booking.id,
-                room_type_id=room_req["room_type_id"],
-                quantity=room_req["quantity"],
-                price_per_night=room_type_prices[room_req["room_type_id"]]
-            )
-            db.add(booking_item)
+        # 3d. Create child booking_items (single executemany)
+        await db.execute(
+            insert(BookingItem),
+            [
+                {
+                    "booking_id": booking.id,
+                    "room_type_id": room_req["room_type_id"],
+                    "quantity": room_req["quantity"],
+                    "price_per_night": room_type_prices[room_req["room_type_id"]]
+                }
+                for room_req in room_requests
+            ]
+        )
         
-        await db.flush()
+        # 3e. Update the daily stats rollup (same transaction)
+        await record_booking_change(db, None, snapshot_booking(booking))
     
     # ==========================================================================
     # STEP 4: Commit and reload
@@ -7,11 +7,15 @@ from app.utils.date_utils import (
     validate_date_range,
     get_future_dates
 )
+from app.utils.segment_tree import SegmentTree, min_tree, sum_tree
 
 __all__ = [
     "get_date_range",
     "get_date_list", 
     "count_nights",
     "validate_date_range",
-    "get_future_dates"
+    "get_future_dates",
+    "SegmentTree",
+    "min_tree",
+    "sum_tree"
 ]
@@ -4,6 +4,9 @@ Date utilities for the hotel PMS.
 
 from datetime import date, timedelta
 from typing import List, Generator
+from sqlalchemy import Date, DateTime, Integer, cast, func, literal, literal_column, select
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import CTE
 
 
 def get_date_range(start_date: date, end_date: date) -> Generator[date, None, None]:
@@ -84,3 +87,68 @@ def get_future_dates(days_ahead: int) -> List[date]:
     """
     today = date.today()
     return [today + timedelta(days=i) for i in range(days_ahead)]
+
+
+def sql_days_between(
+    dialect_name: str,
+    start: ColumnElement,
+    end: ColumnElement
+) -> ColumnElement:
+    """
+    SQL expression for the number of days from start to end (e.g. nights
+    between check_in and check_out), using the dialect's date arithmetic.
+    
+    Args:
+        dialect_name: SQLAlchemy dialect name (sqlite, postgresql, ...)
+        start: Date column or expression
+        end: Date column or expression
+    
+    Returns:
+        Integer SQL expression
+    """
+    if dialect_name == "sqlite":
+        return cast(func.julianday(end) - func.julianday(start), Integer)
+    
+    if dialect_name == "postgresql":
+        # date - date yields an integer number of days
+        return end - start
+    
+    return func.datediff(end, start)
+
+
+def sql_date_series(dialect_name: str, start_date: date, end_date: date) -> CTE:
+    """
+    SQL date series with one row per day in [start_date, end_date].
+    
+    Uses generate_series on PostgreSQL and a recursive CTE elsewhere.
+    
+    Args:
+        dialect_name: SQLAlchemy dialect name (sqlite, postgresql, ...)
+        start_date: First day (inclusive)
+        end_date: Last day (inclusive)
+    
+    Returns:
+        CTE with a single Date column named "night"
+    """
+    if dialect_name == "postgresql":
+        return select(
+            cast(
+                func.generate_series(
+                    cast(literal(start_date, Date), DateTime),
+                    cast(literal(end_date, Date), DateTime),
+                    literal_column("interval '1 day'")
+                ),
+                Date
+            ).label("night")
+        ).cte("nights")
+    
+    series = select(literal(start_date, Date).label("night")).cte("nights", recursive=True)
+    
+    if dialect_name == "sqlite":
+        next_day = func.date(series.c.night, "+1 day", type_=Date)
+    else:
+        next_day = series.c.night + literal_column("INTERVAL '1' DAY")
+    
+    return series.union_all(
+        select(next_day).where(series.c.night < end_date)
+    )
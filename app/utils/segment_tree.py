@@ -0,0 +1,101 @@
+"""
+Segment tree for O(log n) range aggregates with point updates.
+"""
+
+import operator
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+# Identity for range-min over integer values
+INF = float("inf")
+
+
+class SegmentTree:
+    """
+    Iterative (bottom-up) segment tree over a fixed-size sequence.
+    
+    Supports any associative combine function with an identity element,
+    e.g. min/INF for range minimum or operator.add/0 for range sum.
+    
+    Example:
+        ```python
+        tree = SegmentTree([5, 3, 4], combine=min, identity=INF)
+        tree.query(0, 3)   # 3
+        tree.update(1, 6)
+        tree.query(0, 3)   # 4
+        ```
+    """
+    
+    __slots__ = ("size", "combine", "identity", "tree")
+    
+    def __init__(
+        self,
+        values: Iterable[T],
+        combine: Callable[[T, T], T],
+        identity: T
+    ):
+        values = list(values)
+        self.size = len(values)
+        self.combine = combine
+        self.identity = identity
+        
+        # Leaves live at [size, 2 * size); node i covers children 2i and 2i + 1
+        self.tree: List[T] = [identity] * self.size + values
+        for i in range(self.size - 1, 0, -1):
+            self.tree[i] = combine(self.tree[2 * i], self.tree[2 * i + 1])
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def update(self, index: int, value: T) -> None:
+        """
+        Replace the value at a position.
+        
+        Args:
+            index: Position in the sequence (0-based)
+            value: New value
+        """
+        i = index + self.size
+        self.tree[i] = value
+        i //= 2
+        while i >= 1:
+            self.tree[i] = self.combine(self.tree[2 * i], self.tree[2 * i + 1])
+            i //= 2
+    
+    def query(self, start: int, end: int) -> T:
+        """
+        Aggregate the values in [start, end).
+        
+        Args:
+            start: First position (inclusive)
+            end: Last position (exclusive)
+        
+        Returns:
+            Combined value, or the identity for an empty range
+        """
+        start = max(start, 0) + self.size
+        end = min(end, self.size) + self.size
+        left = right = self.identity
+        
+        while start < end:
+            if start & 1:
+                left = self.combine(left, self.tree[start])
+                start += 1
+            if end & 1:
+                end -= 1
+                right = self.combine(self.tree[end], right)
+            start //= 2
+            end //= 2
+        
+        return self.combine(left, right)
+
+
+def min_tree(values: Iterable[int]) -> SegmentTree:
+    """Build a range-minimum segment tree."""
+    return SegmentTree(values, combine=min, identity=INF)
+
+
+def sum_tree(values: Iterable[int]) -> SegmentTree:
+    """Build a range-sum segment tree."""
+    return SegmentTree(values, combine=operator.add, identity=0)
@@ -0,0 +1,53 @@
+"""
+Streaming response helpers for large list endpoints.
+"""
+
+from typing import AsyncIterator, Type
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def _ndjson_lines(items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    async for item in items:
+        yield item.model_dump_json() + "\n"
+
+
+def ndjson_response(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+    """
+    Write schema objects as newline-delimited JSON while they are produced.
+    
+    Args:
+        items: Async iterator of Pydantic models (one JSON object per line)
+    
+    Returns:
+        StreamingResponse with media type application/x-ndjson
+    """
+    return StreamingResponse(_ndjson_lines(items), media_type=NDJSON_MEDIA_TYPE)
+
+
+def ndjson_responses(model: Type[BaseModel]) -> dict:
+    """
+    OpenAPI `responses` entry documenting the `stream=true` variant of a
+    list endpoint next to its JSON array response.
+    
+    Args:
+        model: Schema of each line (the list item of the response_model)
+    
+    Returns:
+        Mapping for the route's `responses` argument
+    """
+    return {
+        200: {
+            "description": (
+                f"JSON array of {model.__name__}, or with stream=true one "
+                f"{model.__name__} JSON object per line"
+            ),
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "schema": {"$ref": f"#/components/schemas/{model.__name__}"}
+                }
+            }
+        }
+    }